@@ -1,36 +1,48 @@
+import logging
 import os
-from PIL import Image, ImageDraw
+
+logger = logging.getLogger(__name__)
+
+ICON_PATH = "assets/icon.ico"
 
 def create_icon():
     """
     Создает и сохраняет файл иконки 'assets/icon.ico' для уведомлений и трея.
+    Если иконка уже существует, повторная генерация не выполняется.
     """
+    # Иконка уже сгенерирована - ничего не делаем
+    if os.path.exists(ICON_PATH) and os.path.getsize(ICON_PATH) > 0:
+        return
+
+    # Pillow импортируется только когда иконку действительно нужно нарисовать
+    from PIL import Image, ImageDraw
+
     # Создаем директорию, если ее нет
-    if not os.path.exists("assets"):
-        os.makedirs("assets")
+    os.makedirs("assets", exist_ok=True)
 
-    # Параметры иконки
-    img_size = (64, 64)
+    # Параметры иконки: рисуем один мастер-кадр 256x256,
+    # а кадры .ico получаем уменьшением при сохранении
+    img_size = (256, 256)
     bg_color = (255, 255, 255, 0)  # Прозрачный фон
     circle_color = "#1F6AA5"      # Цвет круга (в стиле customtkinter)
-    
+
     # Создаем изображение
     img = Image.new('RGBA', img_size, bg_color)
     draw = ImageDraw.Draw(img)
 
     # Рисуем простой круг в центре как иконку
-    padding = 10
+    # (отступ пропорционален размеру, чтобы все кадры выглядели одинаково)
+    padding = 40
     draw.ellipse(
         (padding, padding, img_size[0] - padding, img_size[1] - padding),
-        fill=circle_color,
-        outline=circle_color
+        fill=circle_color
     )
-    
+
     # Сохраняем файл в формате .ico
-    icon_path = "assets/icon.ico"
-    # Указываем формат и размеры для .ico файла
-    img.save(icon_path, format='ICO', sizes=[(32, 32), (48, 48), (64, 64)])
-    print(f"Иконка успешно создана и сохранена в '{icon_path}'")
+    # Указываем формат и размеры для .ico файла; кадры сжимаются как PNG
+    img.save(ICON_PATH, format='ICO', sizes=[(32, 32), (48, 48), (64, 64)], bitmap_format='png')
+    logger.debug("Иконка успешно создана и сохранена в '%s'", ICON_PATH)
 
 if __name__ == "__main__":
-    create_icon()
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG)
+    create_icon()
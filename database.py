@@ -1,10 +1,197 @@
+import contextlib
+import logging
 import sqlite3
+import sys
 import threading
-from typing import List, Tuple, Optional
+import time
+import pathlib
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
 import datetime
 
+logger = logging.getLogger(__name__)
+
 DB_FILE = "reminders.db"
 
+# Дата и время срабатывания на входе API: строка ISO 8601, datetime или Unix-время в секундах
+DueDateTime = str | datetime.datetime | int
+
+
+class Reminder(NamedTuple):
+    """Строка таблицы напоминаний; поля в порядке столбцов SQL_SELECT_COLUMNS."""
+    id: int
+    title: str
+    description: str
+    due: str  # Дата и время срабатывания в ISO 8601
+    status: str
+
+
+def _reminder_row(cursor: sqlite3.Cursor, row: tuple) -> Reminder:
+    """row_factory курсора: строка выборки SQL_SELECT_COLUMNS -> Reminder."""
+    return Reminder._make(row)
+
+# Допустимые статусы напоминаний (проверка фильтра - одна операция поиска по хешу)
+_VALID_STATUSES = frozenset(map(sys.intern, ("Ожидает", "Выполнено", "Просрочено", "Отменено")))
+
+# Буферное время (в секундах), после которого ожидающее напоминание считается просроченным
+OVERDUE_GRACE_SECONDS = 120
+
+# Размер кэша подготовленных выражений sqlite3 (ключ - текст SQL)
+STATEMENT_CACHE_SIZE = 256
+
+# Настройки соединения: ожидание блокировки до 5 с вместо немедленной ошибки
+# "database is locked", кэш страниц ~20 МБ, временные таблицы в памяти,
+# чтение файла БД через mmap (до 256 МБ) вместо системных вызовов read()
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Сколько строк за раз читается из курсора в iter_reminders
+FETCH_BATCH_SIZE = 256
+
+# Максимум ID в одном UPDATE ... IN (...), с запасом до лимита параметров SQLite
+BULK_CHUNK_SIZE = 500
+
+# Время срабатывания хранится как INTEGER (Unix-время в секундах, по локальным часам);
+# в строку ISO 8601 оно преобразуется только на границе модуля
+SQL_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS reminders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        due_datetime INTEGER NOT NULL,
+        status TEXT NOT NULL
+    )
+"""
+SQL_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_reminders_status_due ON reminders (status, due_datetime)"
+# Отдельный индекс по времени для списка без фильтра (ORDER BY без сортировки во временном B-дереве)
+SQL_CREATE_DUE_INDEX = "CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_datetime)"
+# Вся схема создается одним скриптом в одной транзакции
+SQL_CREATE_SCHEMA = (
+    "BEGIN IMMEDIATE;"
+    + SQL_CREATE_TABLE + ";"
+    + SQL_CREATE_INDEX + ";"
+    + SQL_CREATE_DUE_INDEX + ";"
+    "COMMIT;"
+)
+
+# SQL-выражения фиксированы, чтобы каждый вызов попадал в кэш выражений
+SQL_INSERT = "INSERT INTO reminders (title, description, due_datetime, status) VALUES (?, ?, ?, ?)"
+SQL_INSERT_RETURNING_ID = SQL_INSERT + " RETURNING id"
+SQL_UPDATE = "UPDATE reminders SET title = ?, description = ?, due_datetime = ? WHERE id = ?"
+# Отсрочка: новое время, снова статус 'Ожидает' (сработавшее напоминание уже помечено
+# выполненным) и дописывание заметки к описанию на стороне SQLite
+SQL_SNOOZE = (
+    "UPDATE reminders SET due_datetime = ?, status = 'Ожидает', "
+    "description = COALESCE(description, '') || ? WHERE id = ?"
+)
+SQL_UPDATE_STATUS = "UPDATE reminders SET status = ? WHERE id = ?"
+SQL_TRANSITION_STATUS = "UPDATE reminders SET status = ? WHERE id = ? AND status != ?"
+SQL_DELETE = "DELETE FROM reminders WHERE id = ?"
+# Время срабатывания отдается наружу строкой ISO 8601 по локальным часам прямо из SQLite;
+# сортировка и условия по времени идут по исходному INTEGER-столбцу (reminders.due_datetime,
+# а не по одноименному псевдониму), чтобы работал индекс
+SQL_SELECT_COLUMNS = (
+    "SELECT id, title, description, "
+    "strftime('%Y-%m-%dT%H:%M:%S', due_datetime, 'unixepoch', 'localtime') AS due_datetime, status "
+    "FROM reminders"
+)
+SQL_SELECT_ALL_ASC = SQL_SELECT_COLUMNS + " ORDER BY reminders.due_datetime ASC"
+SQL_SELECT_ALL_DESC = SQL_SELECT_COLUMNS + " ORDER BY reminders.due_datetime DESC"
+SQL_SELECT_BY_STATUS_ASC = SQL_SELECT_COLUMNS + " WHERE status = ? ORDER BY reminders.due_datetime ASC"
+SQL_SELECT_BY_STATUS_DESC = SQL_SELECT_COLUMNS + " WHERE status = ? ORDER BY reminders.due_datetime DESC"
+SQL_SELECT_BY_ID = SQL_SELECT_COLUMNS + " WHERE id = ?"
+SQL_SELECT_DUE = SQL_SELECT_COLUMNS + " WHERE status = 'Ожидает' AND reminders.due_datetime <= ? ORDER BY reminders.due_datetime ASC"
+SQL_NEXT_DUE = "SELECT MIN(due_datetime) FROM reminders WHERE status = 'Ожидает'"
+SQL_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM reminders GROUP BY status"
+SQL_HAS_OVERDUE = "SELECT 1 FROM reminders WHERE status = 'Ожидает' AND due_datetime < ? LIMIT 1"
+SQL_MARK_OVERDUE = "UPDATE reminders SET status = 'Просрочено' WHERE status = 'Ожидает' AND due_datetime < ?"
+
+# Перенос старой схемы (due_datetime TEXT в формате ISO 8601) на INTEGER
+SQL_MIGRATE_DUE_TO_EPOCH = """
+    BEGIN IMMEDIATE;
+    ALTER TABLE reminders RENAME TO reminders_old;
+""" + SQL_CREATE_TABLE + """;
+    INSERT INTO reminders (id, title, description, due_datetime, status)
+        SELECT id, title, description, CAST(strftime('%s', due_datetime, 'utc') AS INTEGER), status
+        FROM reminders_old;
+    DROP TABLE reminders_old;
+    COMMIT;
+"""
+
+# Варианты выборки: (фильтр по статусу?, порядок сортировки) -> SQL
+SQL_SELECT = {
+    (False, "ASC"): SQL_SELECT_ALL_ASC,
+    (False, "DESC"): SQL_SELECT_ALL_DESC,
+    (True, "ASC"): SQL_SELECT_BY_STATUS_ASC,
+    (True, "DESC"): SQL_SELECT_BY_STATUS_DESC,
+}
+
+def _configure_connection(conn: sqlite3.Connection):
+    """
+    Применяет CONNECTION_PRAGMAS к новому соединению (и на запись, и на чтение).
+    """
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+def _to_timestamp(due_datetime: DueDateTime) -> int:
+    """
+    Преобразует дату и время (Unix-время, datetime или строку ISO 8601) в Unix-время
+    для хранения в БД. Целое число и datetime используются без разбора строки.
+
+    :raises ValueError: Если строка не является датой в формате ISO 8601.
+    """
+    if isinstance(due_datetime, int):
+        return due_datetime
+    if isinstance(due_datetime, datetime.datetime):
+        return int(due_datetime.timestamp())
+    try:
+        return int(datetime.datetime.fromisoformat(due_datetime).timestamp())
+    except ValueError:
+        raise ValueError(f"Некорректный формат даты: {due_datetime}. Ожидается ISO 8601")
+
+def _validate_reminder(title: str, due_datetime: DueDateTime) -> int:
+    """
+    Проверяет заголовок и дату напоминания и возвращает время срабатывания как Unix-время.
+    Сообщения об ошибках формируются только при их возникновении.
+
+    :raises ValueError: Если входные данные невалидны.
+    """
+    if not title or not isinstance(title, str):
+        raise ValueError("Заголовок обязателен и должен быть строкой")
+    return _validate_due(due_datetime)
+
+def _validate_due(due_datetime: DueDateTime) -> int:
+    """
+    Проверяет дату и время срабатывания и возвращает их как Unix-время.
+
+    :raises ValueError: Если дата не задана или имеет неподдерживаемый тип/формат.
+    """
+    if (not due_datetime or isinstance(due_datetime, bool)
+            or not isinstance(due_datetime, (str, datetime.datetime, int))):
+        raise ValueError("Дата и время обязательны: строка ISO 8601, datetime или Unix-время")
+    return _to_timestamp(due_datetime)
+
+def _execute_for_ids(cursor: sqlite3.Cursor, sql_template: str, ids: list[int]) -> int:
+    """
+    Выполняет выражение с условием id IN (...) порциями по BULK_CHUNK_SIZE ID,
+    чтобы не превысить лимит параметров SQLite.
+
+    :param cursor: Курсор внутри открытой транзакции.
+    :param sql_template: SQL с местом "{}" под список плейсхолдеров.
+    :param ids: ID строк.
+    :return: Суммарное количество измененных строк.
+    """
+    changed_count = 0
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        chunk = ids[start:start + BULK_CHUNK_SIZE]
+        cursor.execute(sql_template.format(", ".join("?" * len(chunk))), chunk)
+        changed_count += cursor.rowcount
+    return changed_count
+
 class Database:
     """
     Класс для управления базой данных SQLite для напоминаний.
@@ -14,79 +201,240 @@ class Database:
         """
         Инициализирует соединение с базой данных и создает таблицу, если она не существует.
 
+        Запись идет через одно соединение self.conn под блокировкой self._write_lock,
+        в явных транзакциях (см. _transaction); соединение работает в режиме autocommit,
+        поэтому чтение не открывает неявных транзакций.
+        Чтение идет через отдельные read-only соединения, по одному на поток: в режиме
+        WAL читатели не блокируют писателя и друг друга.
+
         :param db_file: Путь к файлу базы данных.
         """
+        self.db_file = db_file
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._read_conns = []
+        self._read_conns_lock = threading.Lock()
+        self._on_change = None
         try:
-            self.conn = sqlite3.connect(db_file, check_same_thread=False)
+            self.conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None,
+                                        cached_statements=STATEMENT_CACHE_SIZE)
+            # WAL + synchronous=NORMAL: фиксация транзакции без fsync на каждую запись.
+            # В режиме WAL рядом с БД появляются служебные файлы <db>-wal и <db>-shm
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            _configure_connection(self.conn)
             self.cursor = self.conn.cursor()
             self.create_table()
-            self.lock = threading.Lock()
-        except sqlite3.Error as e:
-            print(f"Ошибка подключения к базе данных: {e}")
+        except sqlite3.Error:
+            logger.exception("Ошибка подключения к базе данных")
             self.conn = None
             self.cursor = None
 
     def create_table(self):
         """
-        Создает таблицу 'reminders' в базе данных, если она еще не создана.
+        Создает таблицу 'reminders' и индексы по (status, due_datetime) и due_datetime,
+        если они еще не созданы.
         """
         if not self.cursor:
             return
         try:
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS reminders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    due_datetime TEXT NOT NULL,
-                    status TEXT NOT NULL
-                )
-            """)
-            self.conn.commit()
-        except sqlite3.Error as e:
-            print(f"Ошибка при создании таблицы: {e}")
+            # Сначала перенос старой схемы (если есть), затем таблица и индексы
+            # для фильтрации по статусу и сортировки/сравнения по времени - одной транзакцией
+            self._migrate_due_datetime()
+            self.cursor.executescript(SQL_CREATE_SCHEMA)
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
+            logger.exception("Ошибка при создании таблицы")
+
+    def _migrate_due_datetime(self):
+        """
+        Переводит столбец due_datetime из TEXT (ISO 8601) в INTEGER для баз,
+        созданных предыдущими версиями приложения.
+        """
+        # Для новой БД таблицы еще нет: PRAGMA вернет пустой список
+        columns = {row[1]: row[2] for row in self.cursor.execute("PRAGMA table_info(reminders)")}
+        if columns.get("due_datetime", "").upper() != "TEXT":
+            return
+        try:
+            self.cursor.executescript(SQL_MIGRATE_DUE_TO_EPOCH)
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
+            raise
 
-    def add_reminder(self, title: str, description: str, due_datetime: str) -> Optional[int]:
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Явная транзакция записи: BEGIN IMMEDIATE ... COMMIT под блокировкой записи.
+        При исключении транзакция откатывается, исключение пробрасывается дальше.
+        """
+        with self._write_lock:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.cursor
+                self.cursor.execute("COMMIT")
+            except BaseException:
+                if self.conn.in_transaction:
+                    self.cursor.execute("ROLLBACK")
+                raise
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Возвращает read-only соединение текущего потока, открывая его при первом обращении.
+        Для базы в памяти отдельное соединение невозможно - используется self.conn.
+        """
+        if self.db_file in ("", ":memory:"):
+            return self.conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            uri = pathlib.Path(self.db_file).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+            _configure_connection(conn)
+            self._local.conn = conn
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """
+        Выдает соединение для чтения. Для базы в памяти это общее соединение,
+        поэтому на время блока берется блокировка записи.
+        """
+        conn = self._read_conn()
+        if conn is self.conn:
+            with self._write_lock:
+                yield conn
+        else:
+            yield conn
+
+    def set_change_callback(self, callback: Callable[[], None] | None):
+        """
+        Задает функцию, вызываемую после изменения напоминаний (добавление, правка,
+        смена статуса, удаление) - например, для перепланирования проверки.
+
+        :param callback: Функция без аргументов или None, чтобы отключить уведомление.
+        """
+        self._on_change = callback
+
+    def _notify_change(self):
+        """
+        Вызывает функцию, заданную через set_change_callback, если она есть.
+        Ошибки в ней логируются и не прерывают операцию с БД.
+        """
+        if self._on_change is None:
+            return
+        try:
+            self._on_change()
+        except Exception:
+            logger.exception("Ошибка в обработчике изменения напоминаний")
+
+    def add_reminder(self, title: str, description: str, due_datetime: DueDateTime) -> int | None:
         """
         Добавляет новое напоминание в базу данных.
 
         :param title: Заголовок напоминания.
         :param description: Описание напоминания.
-        :param due_datetime: Дата и время срабатывания в формате ISO 8601.
+        :param due_datetime: Дата и время срабатывания (строка ISO 8601, datetime или Unix-время).
         :return: ID добавленного напоминания или None в случае ошибки.
         :raises ValueError: Если входные данные невалидны.
         """
         if not self.conn:
             raise RuntimeError("Соединение с базой данных не установлено")
 
-        # Валидация входных данных
-        if not title or not isinstance(title, str):
-            raise ValueError("Заголовок обязателен и должен быть строкой")
-        if not due_datetime or not isinstance(due_datetime, str):
-            raise ValueError("Дата и время обязательны и должны быть строкой")
+        due_ts = _validate_reminder(title, due_datetime)
+        return self.add_reminder_unchecked(title, description, due_ts)
 
-        try:
-            # Проверка формата даты
-            datetime.datetime.fromisoformat(due_datetime)
-        except ValueError:
-            raise ValueError(f"Некорректный формат даты: {due_datetime}. Ожидается ISO 8601")
+    def add_reminder_unchecked(self, title: str, description: str, due_ts: int) -> int:
+        """
+        Добавляет напоминание без проверки аргументов - для доверенных внутренних вызовов,
+        у которых данные уже проверены.
 
+        :param title: Заголовок напоминания.
+        :param description: Описание напоминания.
+        :param due_ts: Время срабатывания как Unix-время в секундах.
+        :return: ID добавленного напоминания.
+        :raises RuntimeError: При ошибках базы данных.
+        """
         try:
-            sql = "INSERT INTO reminders (title, description, due_datetime, status) VALUES (?, ?, ?, ?)"
-            self.cursor.execute(sql, (title, description or "", due_datetime, "Ожидает"))
-            self.conn.commit()
-            return self.cursor.lastrowid
+            with self._transaction() as cursor:
+                reminder_id = cursor.execute(SQL_INSERT_RETURNING_ID,
+                                             (title, description or "", due_ts, "Ожидает")).fetchone()[0]
         except sqlite3.Error as e:
-            self.conn.rollback()
             raise RuntimeError(f"Ошибка при добавлении напоминания: {e}")
+        self._notify_change()
+        return reminder_id
 
-    def get_reminders(self, status_filter: Optional[str] = None, sort_order: str = "ASC") -> List[Tuple]:
+    def add_reminders_bulk(self, rows: list[tuple]) -> list[int]:
+        """
+        Добавляет несколько напоминаний одной транзакцией.
+
+        :param rows: Кортежи (заголовок, описание, дата и время - строка ISO 8601, datetime
+            или Unix-время).
+        :return: Список ID добавленных напоминаний в порядке строк.
+        :raises ValueError: Если дата в одной из строк невалидна.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        params = [(title, description or "", _to_timestamp(due_datetime), "Ожидает")
+                  for title, description, due_datetime in rows]
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(SQL_INSERT, params)
+                # Внутри одной транзакции ID выдаются подряд
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при добавлении напоминаний: {e}")
+        self._notify_change()
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
+    def get_reminder(self, reminder_id: int) -> Reminder | None:
+        """
+        Получает одно напоминание по ID (поиск по первичному ключу).
+
+        :param reminder_id: ID напоминания.
+        :return: Напоминание (Reminder) или None, если его нет.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        try:
+            with self._reading() as conn:
+                row = conn.execute(SQL_SELECT_BY_ID, (reminder_id,)).fetchone()
+                return Reminder._make(row) if row is not None else None
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при получении напоминания: {e}")
+
+    def get_reminders(self, status_filter: str | None = None, sort_order: str = "ASC",
+                      dict_rows: bool = False) -> list[Reminder]:
         """
         Получает список напоминаний из базы данных.
 
         :param status_filter: Фильтр по статусу. Если None, возвращает все.
         :param sort_order: Порядок сортировки по дате ('ASC' или 'DESC').
-        :return: Список кортежей с данными напоминаний.
+        :param dict_rows: Вернуть sqlite3.Row (доступ и по индексу, и по имени столбца)
+            вместо Reminder.
+        :return: Список напоминаний (Reminder).
+        :raises ValueError: Если параметры невалидны.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        return list(self.iter_reminders(status_filter, sort_order, dict_rows))
+
+    def iter_reminders(self, status_filter: str | None = None, sort_order: str = "ASC",
+                       dict_rows: bool = False) -> Iterator[Reminder]:
+        """
+        Возвращает напоминания лениво, порциями по FETCH_BATCH_SIZE строк.
+        Чтение идет через read-only соединение потока и не ждет блокировки записи.
+
+        :param status_filter: Фильтр по статусу. Если None, возвращает все.
+        :param sort_order: Порядок сортировки по дате ('ASC' или 'DESC').
+        :param dict_rows: Вернуть sqlite3.Row вместо Reminder.
+        :return: Итератор напоминаний (Reminder).
         :raises ValueError: Если параметры невалидны.
         :raises RuntimeError: При ошибках базы данных.
         """
@@ -97,58 +445,134 @@ class Database:
         if sort_order not in ("ASC", "DESC"):
             raise ValueError("Параметр sort_order должен быть 'ASC' или 'DESC'")
 
-        if status_filter and status_filter != "Все" and status_filter not in ("Ожидает", "Выполнено", "Просрочено", "Отменено"):
+        if status_filter and status_filter != "Все" and status_filter not in _VALID_STATUSES:
             raise ValueError(f"Некорректный статус фильтра: {status_filter}")
 
-        with self.lock:
-            try:
-                sql = "SELECT * FROM reminders"
-                params = []
-                if status_filter and status_filter != "Все":
-                    sql += " WHERE status = ?"
-                    params.append(status_filter)
-
-                sql += " ORDER BY due_datetime " + sort_order
-                self.cursor.execute(sql, params)
-                return self.cursor.fetchall()
-            except sqlite3.Error as e:
-                raise RuntimeError(f"Ошибка при получении напоминаний: {e}")
+        status_key = status_filter if status_filter and status_filter != "Все" else None
+        params = () if status_key is None else (status_key,)
+        sql = SQL_SELECT[(status_key is not None, sort_order)]
+        try:
+            with self._reading() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row if dict_rows else _reminder_row
+                cursor.execute(sql, params)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при получении напоминаний: {e}")
+        return self._iter_rows(cursor)
+
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor) -> Iterator[tuple]:
+        """
+        Читает строки курсора порциями.
+        """
+        try:
+            while True:
+                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при получении напоминаний: {e}")
+        finally:
+            cursor.close()
 
-    def update_reminder(self, reminder_id: int, title: str, description: str, due_datetime: str):
+    def count_by_status(self) -> dict[str, int]:
+        """
+        Считает напоминания по статусам одним запросом GROUP BY.
+
+        :return: Словарь {статус: количество}; статусы без напоминаний отсутствуют.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        try:
+            with self._reading() as conn:
+                return dict(conn.execute(SQL_COUNT_BY_STATUS).fetchall())
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при подсчете напоминаний: {e}")
+
+    def get_next_due_timestamp(self) -> int | None:
+        """
+        Возвращает время ближайшего ожидающего напоминания.
+
+        :return: Unix-время в секундах или None, если ожидающих напоминаний нет.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        try:
+            with self._reading() as conn:
+                return conn.execute(SQL_NEXT_DUE).fetchone()[0]
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при получении ближайшего напоминания: {e}")
+
+    def update_reminder(self, reminder_id: int, title: str, description: str, due_datetime: DueDateTime):
         """
         Обновляет данные существующего напоминания.
 
         :param reminder_id: ID напоминания для обновления.
         :param title: Новый заголовок.
         :param description: Новое описание.
-        :param due_datetime: Новая дата и время.
+        :param due_datetime: Новая дата и время (строка ISO 8601, datetime или Unix-время).
         :raises ValueError: Если входные данные невалидны.
         :raises RuntimeError: При ошибках базы данных.
         """
         if not self.conn:
             raise RuntimeError("Соединение с базой данных не установлено")
 
-        # Валидация входных данных
-        if not title or not isinstance(title, str):
-            raise ValueError("Заголовок обязателен и должен быть строкой")
         if reminder_id is None or not isinstance(reminder_id, int) or reminder_id <= 0:
             raise ValueError("Некорректный ID напоминания")
-        if not due_datetime or not isinstance(due_datetime, str):
-            raise ValueError("Дата и время обязательны и должны быть строкой")
+        due_ts = _validate_reminder(title, due_datetime)
 
         try:
-            # Проверка формата даты
-            datetime.datetime.fromisoformat(due_datetime)
-        except ValueError:
-            raise ValueError(f"Некорректный формат даты: {due_datetime}. Ожидается ISO 8601")
+            with self._transaction() as cursor:
+                cursor.execute(SQL_UPDATE, (title, description or "", due_ts, reminder_id))
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при обновлении напоминания: {e}")
+        self._notify_change()
+
+    def snooze_reminder(self, reminder_id: int, new_due: DueDateTime, appended_note: str = ""):
+        """
+        Откладывает напоминание: меняет время, возвращает статус 'Ожидает',
+        чтобы напоминание сработало снова, и дописывает заметку к описанию.
+        Заголовок и описание не передаются из Python, конкатенация идет в SQL.
+
+        :param reminder_id: ID напоминания.
+        :param new_due: Новая дата и время (строка ISO 8601, datetime или Unix-время).
+        :param appended_note: Текст, добавляемый в конец описания.
+        :raises ValueError: Если входные данные невалидны.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        self.snooze_reminders([reminder_id], new_due, appended_note)
+
+    def snooze_reminders(self, reminder_ids: list[int], new_due: DueDateTime, appended_note: str = "") -> int:
+        """
+        Откладывает несколько напоминаний одной транзакцией (см. snooze_reminder).
+
+        :param reminder_ids: ID напоминаний.
+        :param new_due: Новая дата и время (строка ISO 8601, datetime или Unix-время).
+        :param appended_note: Текст, добавляемый в конец описания.
+        :return: Количество измененных строк.
+        :raises ValueError: Если список ID пуст или дата невалидна.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not reminder_ids:
+            raise ValueError("Не переданы ID напоминаний для отсрочки")
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        due_ts = _validate_due(new_due)
 
         try:
-            sql = "UPDATE reminders SET title = ?, description = ?, due_datetime = ? WHERE id = ?"
-            self.cursor.execute(sql, (title, description or "", due_datetime, reminder_id))
-            self.conn.commit()
+            with self._transaction() as cursor:
+                cursor.executemany(SQL_SNOOZE, ((due_ts, appended_note, reminder_id) for reminder_id in reminder_ids))
+                snoozed_count = cursor.rowcount
         except sqlite3.Error as e:
-            self.conn.rollback()
-            raise RuntimeError(f"Ошибка при обновлении напоминания: {e}")
+            raise RuntimeError(f"Ошибка при отсрочке напоминаний: {e}")
+        self._notify_change()
+        return snoozed_count
 
     def update_reminder_status(self, reminder_id: int, status: str):
         """
@@ -160,11 +584,54 @@ class Database:
         if not self.conn:
             return
         try:
-            sql = "UPDATE reminders SET status = ? WHERE id = ?"
-            self.cursor.execute(sql, (status, reminder_id))
-            self.conn.commit()
+            self.transition_status(reminder_id, status)
+        except RuntimeError:
+            logger.exception("Ошибка при обновлении статуса")
+
+    def transition_status(self, reminder_id: int, status: str, prev_guard: str | None = None) -> bool:
+        """
+        Атомарно переводит напоминание в новый статус одним UPDATE.
+
+        :param reminder_id: ID напоминания.
+        :param status: Новый статус.
+        :param prev_guard: Если задан, строка не обновляется, когда ее текущий статус
+            равен prev_guard (например, повторный клик или гонка планировщика и UI).
+        :return: True, если строка была изменена.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        try:
+            with self._transaction() as cursor:
+                if prev_guard is None:
+                    cursor.execute(SQL_UPDATE_STATUS, (status, reminder_id))
+                else:
+                    cursor.execute(SQL_TRANSITION_STATUS, (status, reminder_id, prev_guard))
+                changed = cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"Ошибка при обновлении статуса: {e}")
+            raise RuntimeError(f"Ошибка при обновлении статуса: {e}")
+        if changed:
+            self._notify_change()
+        return changed
+
+    def mark_completed_bulk(self, reminder_ids: list[int]) -> int:
+        """
+        Помечает несколько напоминаний как 'Выполнено' одной транзакцией.
+        ID обрабатываются порциями по BULK_CHUNK_SIZE на один UPDATE.
+
+        :param reminder_ids: ID напоминаний.
+        :return: Количество измененных строк.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not reminder_ids:
+            return 0
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        try:
+            with self._transaction() as cursor:
+                return _execute_for_ids(cursor, "UPDATE reminders SET status = 'Выполнено' WHERE id IN ({})",
+                                        reminder_ids)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при обновлении статусов: {e}")
 
     def delete_reminder(self, reminder_id: int):
         """
@@ -175,11 +642,34 @@ class Database:
         if not self.conn:
             return
         try:
-            sql = "DELETE FROM reminders WHERE id = ?"
-            self.cursor.execute(sql, (reminder_id,))
-            self.conn.commit()
+            with self._transaction() as cursor:
+                cursor.execute(SQL_DELETE, (reminder_id,))
+        except sqlite3.Error:
+            logger.exception("Ошибка при удалении напоминания")
+            return
+        self._notify_change()
+
+    def delete_reminders(self, reminder_ids: list[int]) -> int:
+        """
+        Удаляет несколько напоминаний одной транзакцией.
+        ID обрабатываются порциями по BULK_CHUNK_SIZE на один DELETE.
+
+        :param reminder_ids: ID напоминаний для удаления.
+        :return: Количество удаленных строк.
+        :raises RuntimeError: При ошибках базы данных.
+        """
+        if not reminder_ids:
+            return 0
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
+
+        try:
+            with self._transaction() as cursor:
+                deleted_count = _execute_for_ids(cursor, "DELETE FROM reminders WHERE id IN ({})", reminder_ids)
         except sqlite3.Error as e:
-            print(f"Ошибка при удалении напоминания: {e}")
+            raise RuntimeError(f"Ошибка при удалении напоминаний: {e}")
+        self._notify_change()
+        return deleted_count
 
     def update_overdue_reminders(self):
         """
@@ -191,713 +681,44 @@ class Database:
         if not self.conn:
             raise RuntimeError("Соединение с базой данных не установлено")
 
-        with self.lock:
+        with self._write_lock:
             try:
                 # Буферное время: помечаем просроченными только те напоминания,
                 # которые просрочены более чем на 2 минуты
-                buffer_time = datetime.datetime.now() - datetime.timedelta(minutes=2)
-                buffer_iso = buffer_time.isoformat()
-                sql = "UPDATE reminders SET status = 'Просрочено' WHERE status = 'Ожидает' AND due_datetime < ?"
-                updated_count = self.cursor.execute(sql, (buffer_iso,)).rowcount
-                self.conn.commit()
+                buffer_ts = int(time.time()) - OVERDUE_GRACE_SECONDS
+                # Дешевая проверка по индексу: если просроченных нет, не пишем и не фиксируем
+                if self.cursor.execute(SQL_HAS_OVERDUE, (buffer_ts,)).fetchone() is None:
+                    return
+                with self._transaction() as cursor:
+                    updated_count = cursor.execute(SQL_MARK_OVERDUE, (buffer_ts,)).rowcount
                 if updated_count > 0:
-                    print(f"[DEBUG] Помечено просроченными {updated_count} напоминаний")
+                    logger.debug("Помечено просроченными %d напоминаний", updated_count)
             except sqlite3.Error as e:
-                self.conn.rollback()
                 raise RuntimeError(f"Ошибка при обновлении просроченных напоминаний: {e}")
 
-    def close(self):
+    def fetch_and_mark_due(self, now_ts: int | None = None) -> list[Reminder]:
         """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
+        Одной транзакцией помечает просроченные напоминания (с учетом буферного времени)
+        и возвращает ожидающие напоминания, время которых уже наступило.
 
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        # Добавление нового напоминания
-        dt = (datetime.datetime.now() + datetime.timedelta(minutes=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание", "Это тестовое сообщение", dt)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-
-
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
+        :param now_ts: Текущее Unix-время; по умолчанию - time.time().
+        :return: Список напоминаний (Reminder) по возрастанию даты.
+        :raises RuntimeError: При ошибках базы данных.
         """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
+        if not self.conn:
+            raise RuntimeError("Соединение с базой данных не установлено")
 
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
+        if now_ts is None:
+            now_ts = int(time.time())
+        try:
+            with self._transaction() as cursor:
+                updated_count = cursor.execute(SQL_MARK_OVERDUE, (now_ts - OVERDUE_GRACE_SECONDS,)).rowcount
+                due_reminders = list(map(Reminder._make, cursor.execute(SQL_SELECT_DUE, (now_ts,))))
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при получении наступивших напоминаний: {e}")
+        if updated_count > 0:
+            logger.debug("Помечено просроченными %d напоминаний", updated_count)
+        return due_reminders
 
     def create_demo_data(self):
         """
@@ -905,84 +726,82 @@ if __name__ == '__main__':
         Очищает существующие данные и добавляет реальные напоминания.
         """
         print("Создание демонстрационных данных...")
+        # Остальной вывод накапливается и печатается одной записью в конце
+        output = []
         
         # Очистка существующих данных
-        with self.lock:
-            try:
-                self.cursor.execute("DELETE FROM reminders")
-                self.conn.commit()
-                print("Старые данные удалены")
-            except sqlite3.Error as e:
-                print(f"Ошибка при очистке данных: {e}")
-                return
+        try:
+            with self._transaction() as cursor:
+                cursor.execute("DELETE FROM reminders")
+            output.append("Старые данные удалены")
+        except sqlite3.Error:
+            logger.exception("Ошибка при очистке данных")
+            return
         
-        # Создание новых напоминаний
-        now = datetime.datetime.now()
+        # Создание новых напоминаний: смещения заданы в секундах от текущего момента
+        base = int(time.time())
         
         # 10 реальных напоминаний с разнообразными датами
         reminders_data = [
             {
                 "title": "Встреча с клиентом",
                 "description": "Обсуждение нового проекта и подписание договора. Подготовить презентацию и коммерческое предложение.",
-                "due_time": now - datetime.timedelta(days=3, hours=2)  # 3 дня назад
+                "due_offset": -(3 * 86400 + 2 * 3600)  # 3 дня назад
             },
             {
                 "title": "Поход к врачу",
                 "description": "Плановый осмотр у терапевта. Не забыть взять медкарту и результаты анализов.",
-                "due_time": now - datetime.timedelta(days=1, hours=5, minutes=30)  # Вчера
+                "due_offset": -(1 * 86400 + 5 * 3600 + 30 * 60)  # Вчера
             },
             {
                 "title": "Оплатить коммунальные услуги",
                 "description": "Оплата за электричество, воду и отопление через онлайн-банк или в отделении банка.",
-                "due_time": now - datetime.timedelta(days=5, hours=10)  # 5 дней назад
+                "due_offset": -(5 * 86400 + 10 * 3600)  # 5 дней назад
             },
             {
                 "title": "Забрать заказ из интернет-магазина",
                 "description": "Получить посылку в пункте выдачи. Код получения: 4521. Работает до 21:00.",
-                "due_time": now - datetime.timedelta(days=2, hours=4)  # 2 дня назад
+                "due_offset": -(2 * 86400 + 4 * 3600)  # 2 дня назад
             },
             {
                 "title": "Созвон с командой разработки",
                 "description": "Еженедельное планирование спринта. Обсудить задачи на следующую неделю и прогресс по текущим.",
-                "due_time": now + datetime.timedelta(days=3, hours=9, minutes=15)  # Через 3 дня
+                "due_offset": 3 * 86400 + 9 * 3600 + 15 * 60  # Через 3 дня
             },
             {
                 "title": "День рождения мамы",
                 "description": "Поздравить маму с днем рождения! Подготовить подарок и букет цветов. Не забыть позвонить утром.",
-                "due_time": now + datetime.timedelta(days=12, hours=8)  # Через 12 дней
+                "due_offset": 12 * 86400 + 8 * 3600  # Через 12 дней
             },
             {
                 "title": "Подача отчета в налоговую",
                 "description": "Подать квартальную декларацию НДС через электронную подпись. Крайний срок - до 25 числа.",
-                "due_time": now + datetime.timedelta(days=15, hours=12)  # Через 15 дней
+                "due_offset": 15 * 86400 + 12 * 3600  # Через 15 дней
             },
             {
                 "title": "Запись на техосмотр автомобиля",
                 "description": "Записаться на диагностику в автосервис. Проверить тормоза, подвеску и световые приборы.",
-                "due_time": now + datetime.timedelta(days=7, hours=13, minutes=45)  # Через неделю
+                "due_offset": 7 * 86400 + 13 * 3600 + 45 * 60  # Через неделю
             },
             {
                 "title": "Покупка продуктов на выходные",
                 "description": "Составить список покупок и съездить в супермаркет. Купить продукты для семейного ужина в воскресенье.",
-                "due_time": now + datetime.timedelta(days=4, hours=17, minutes=20)  # Через 4 дня
+                "due_offset": 4 * 86400 + 17 * 3600 + 20 * 60  # Через 4 дня
             },
             {
                 "title": "Обновление резюме",
                 "description": "Актуализировать информацию о работе и навыках. Добавить последние проекты и достижения.",
-                "due_time": now + datetime.timedelta(days=10, hours=20)  # Через 10 дней
+                "due_offset": 10 * 86400 + 20 * 3600  # Через 10 дней
             }
         ]
         
-        created_ids = []
-        
-        for reminder_data in reminders_data:
-            reminder_id = self.add_reminder(
-                title=reminder_data["title"],
-                description=reminder_data["description"],
-                due_datetime=reminder_data["due_time"].isoformat()
-            )
-            created_ids.append(reminder_id)
-            print(f"[OK] Создано: {reminder_data['title']} (ID: {reminder_id})")
+        # Все напоминания добавляются одной транзакцией
+        created_ids = self.add_reminders_bulk([
+            (reminder_data["title"], reminder_data["description"], base + reminder_data["due_offset"])
+            for reminder_data in reminders_data
+        ])
+        for reminder_data, reminder_id in zip(reminders_data, created_ids):
+            output.append(f"[OK] Создано: {reminder_data['title']} (ID: {reminder_id})")
         
         # Помечаем первые 4 напоминания как выполненные (те, что в прошлом)
         completed_titles = [
@@ -992,1023 +811,93 @@ if __name__ == '__main__':
             "Забрать заказ из интернет-магазина"
         ]
         
-        for i in range(min(4, len(created_ids))):
-            reminder_id = created_ids[i]
-            self.update_reminder_status(reminder_id, "Выполнено")
-            print(f"[OK] Помечено как выполненное: {completed_titles[i]} (ID: {reminder_id})")
+        # ID выданы подряд, поэтому выполненные напоминания - это непрерывный диапазон
+        completed_ids = created_ids[:len(completed_titles)]
+        with self._transaction() as cursor:
+            cursor.execute("UPDATE reminders SET status = 'Выполнено' WHERE id BETWEEN ? AND ?",
+                           (completed_ids[0], completed_ids[-1]))
+        for title, reminder_id in zip(completed_titles, completed_ids):
+            output.append(f"[OK] Помечено как выполненное: {title} (ID: {reminder_id})")
         
         # Статистика
-        all_reminders = self.get_reminders()
-        completed_count = len([r for r in all_reminders if r[4] == "Выполнено"])
-        pending_count = len([r for r in all_reminders if r[4] == "Ожидает"])
+        counts = self.count_by_status()
         
-        print(f"\n=== Итоговая статистика ===")
-        print(f"Всего напоминаний: {len(all_reminders)}")
-        print(f"Ожидает выполнения: {pending_count}")
-        print(f"Выполнено: {completed_count}")
-        print("[SUCCESS] База данных заполнена демонстрационными данными!")
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-        print("\nТестовая база данных удалена.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-
+        output.extend((
+            "\n=== Итоговая статистика ===",
+            f"Всего напоминаний: {sum(counts.values())}",
+            f"Ожидает выполнения: {counts.get('Ожидает', 0)}",
+            f"Выполнено: {counts.get('Выполнено', 0)}",
+            "[SUCCESS] База данных заполнена демонстрационными данными!",
+        ))
+        sys.stdout.write("\n".join(output) + "\n")
 
     def close(self):
         """
-        Закрывает соединение с базой данных.
+        Закрывает соединение с базой данных и все read-only соединения потоков.
         """
+        with self._read_conns_lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
         if self.conn:
             self.conn.close()
 
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-        print("\nТестовая база данных удалена.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-
-
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
-
-if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
+def _demo(db_file: str = ":memory:"):
+    """
+    Пример использования и тестирования модуля.
 
-    def close(self):
-        """
-        Закрывает соединение с базой данных.
-        """
-        if self.conn:
-            self.conn.close()
+    :param db_file: Путь к тестовой базе данных (по умолчанию - в памяти, без записи на диск).
+    """
+    db = Database(db_file)
+    if not db.conn:
+        return
+    print("База данных успешно инициализирована.")
+
+    # Добавление
+    dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
+    r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
+    print(f"Добавлено напоминание с ID: {r_id}")
+
+    dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
+    r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
+    print(f"Добавлено напоминание с ID: {r_id2}")
+
+    # Получение всех
+    print("\nВсе напоминания:")
+    reminders = db.get_reminders()
+    for r in reminders:
+        print(r)
+
+    # Обновление просроченных
+    db.update_overdue_reminders()
+    print("\nПосле обновления просроченных:")
+    reminders = db.get_reminders()
+    for r in reminders:
+        print(r)
+
+    # Обновление статуса
+    if r_id:
+        db.update_reminder_status(r_id, "Выполнено")
+        print(f"\nСтатус напоминания {r_id} обновлен.")
+
+    # Получение выполненных
+    print("\nВыполненные напоминания:")
+    reminders = db.get_reminders(status_filter="Выполнено")
+    for r in reminders:
+        print(r)
+
+    # Удаление
+    if r_id:
+        db.delete_reminder(r_id)
+        print(f"\nНапоминание {r_id} удалено.")
+
+    # Проверка удаления
+    print("\nВсе напоминания после удаления:")
+    reminders = db.get_reminders()
+    print(reminders)
+
+    db.close()
 
 if __name__ == '__main__':
-    # Пример использования и тестирования
-    db = Database("test_reminders.db")
-    if db.conn:
-        print("База данных успешно инициализирована.")
-
-        # Добавление
-        dt1 = (datetime.datetime.now() + datetime.timedelta(days=1)).isoformat()
-        r_id = db.add_reminder("Тестовое напоминание 1", "Описание для теста 1", dt1)
-        print(f"Добавлено напоминание с ID: {r_id}")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-        print("\nТестовая база данных удалена.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-        dt2 = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
-        r_id2 = db.add_reminder("Просроченное", "Это должно стать просроченным", dt2)
-        print(f"Добавлено напоминание с ID: {r_id2}")
-
-        # Получение всех
-        print("\nВсе напоминания:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление просроченных
-        db.update_overdue_reminders()
-        print("\nПосле обновления просроченных:")
-        reminders = db.get_reminders()
-        for r in reminders:
-            print(r)
-
-        # Обновление статуса
-        if r_id:
-            db.update_reminder_status(r_id, "Выполнено")
-            print(f"\nСтатус напоминания {r_id} обновлен.")
-
-        # Получение выполненных
-        print("\nВыполненные напоминания:")
-        reminders = db.get_reminders(status_filter="Выполнено")
-        for r in reminders:
-            print(r)
-
-        # Удаление
-        if r_id:
-            db.delete_reminder(r_id)
-            print(f"\nНапоминание {r_id} удалено.")
-
-        # Проверка удаления
-        print("\nВсе напоминания после удаления:")
-        reminders = db.get_reminders()
-        print(reminders)
-
-        db.close()
-        # Очистка тестовой БД
-        import os
-        os.remove("test_reminders.db")
-        print("\nТестовая база данных удалена.")
-
-
-
+    # По умолчанию БД в памяти; путь к файлу можно передать первым аргументом
+    _demo(sys.argv[1] if len(sys.argv) > 1 else ":memory:")
@@ -3,7 +3,7 @@ import sys
 from tkinter import messagebox
 from database import Database
 from ui import App
-from scheduler import start_scheduler, check_reminders
+from scheduler import start_scheduler, check_reminders, schedule_next_check
 from create_icon import create_icon
 
 def main():
@@ -29,15 +29,18 @@ def main():
     app = App(db=db)
     print("Графический интерфейс создан.")
 
-    # 4. Запуск фонового планировщика с ссылкой на приложение
-    # Планировщик будет проверять напоминания каждые 30 секунд.
-    scheduler = start_scheduler(db, main_app=app)
-
-    # 5. Первоначальная проверка статусов при запуске
+    # 4. Первоначальная проверка статусов при запуске
     # Обновляет просроченные и обрабатывает сработавшие напоминания.
+    # Выполняется до запуска планировщика, чтобы проверки не пересекались.
     print("Первоначальная проверка напоминаний при запуске...")
     check_reminders(db, main_app=app)
 
+    # 5. Запуск фонового планировщика с ссылкой на приложение
+    # Планировщик проверяет напоминания ко времени ближайшего из них;
+    # при любом изменении напоминаний проверка перепланируется.
+    scheduler = start_scheduler(db, main_app=app)
+    db.set_change_callback(lambda: schedule_next_check(scheduler, db, main_app=app))
+
     # 6. Регистрация функции очистки при выходе
     # Гарантирует, что соединение с БД и планировщик будут корректно закрыты.
     atexit.register(lambda: cleanup(app, db, scheduler))
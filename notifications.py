@@ -1,20 +1,30 @@
 from plyer import notification
+import functools
+import logging
 import platform
 import os
 import time
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
+from create_icon import ICON_PATH
 
-def send_notification(title: str, message: str, max_retries: int = 3, reminder_id: int = None, main_app=None):
+logger = logging.getLogger(__name__)
+
+# Через сколько миллисекунд всплывающее окно уведомления закрывается само
+POPUP_TIMEOUT_MS = 8000
+
+def send_notification(title: str, message: str, reminder_id: int = None, main_app=None,
+                      reminder_ids: list[int] | None = None):
     """
     Отправляет системное уведомление с принудительным использованием видимых методов.
 
     :param title: Заголовок уведомления.
     :param message: Текст уведомления.
-    :param max_retries: Максимальное количество попыток отправки.
     :param reminder_id: ID напоминания для активации кнопок отсрочки.
     :param main_app: Ссылка на главное приложение для активации кнопок.
+    :param reminder_ids: ID всех напоминаний, объединенных в одно уведомление
+        (вместо reminder_id, если сработало сразу несколько).
     :raises RuntimeError: Если не удалось отправить уведомление после всех попыток.
     """
     if not title or not isinstance(title, str):
@@ -23,24 +33,27 @@ def send_notification(title: str, message: str, max_retries: int = 3, reminder_i
     if not message or not isinstance(message, str):
         raise ValueError("Текст уведомления обязателен и должен быть строкой")
 
-    print(f"[УВЕДОМЛЕНИЕ] ОТПРАВКА: {title}")
-    print(f"[СООБЩЕНИЕ] {message}")
+    logger.info("Отправка уведомления: %s | %s", title, message)
 
-    # Активируем кнопки отсрочки если передан ID и приложение
-    if reminder_id and main_app and hasattr(main_app, 'set_active_notification'):
+    # Активируем кнопки отсрочки если переданы ID и приложение.
+    # Вызов идет из потока планировщика, поэтому кнопки настраиваются
+    # в главном потоке Tk через after(), как и всплывающее окно
+    if reminder_ids is None:
+        reminder_ids = [reminder_id] if reminder_id else []
+    if reminder_ids and main_app and hasattr(main_app, 'set_active_notifications'):
         try:
-            main_app.set_active_notification(reminder_id)
-            print(f"[УВЕДОМЛЕНИЯ] Активированы кнопки отсрочки для напоминания ID: {reminder_id}")
+            main_app.after(0, main_app.set_active_notifications, list(reminder_ids))
+            logger.info("Активация кнопок отсрочки поставлена в очередь для напоминаний ID: %s", reminder_ids)
         except Exception as e:
-            print(f"[УВЕДОМЛЕНИЯ] Ошибка активации кнопок отсрочки: {e}")
+            logger.error("Ошибка активации кнопок отсрочки: %s", e)
 
-    # ПРИНУДИТЕЛЬНО: Tkinter MessageBox (видимое всплывающее окно)
-    if _try_tkinter_notification(title, message):
-        print("[SUCCESS] Tkinter уведомление показано")
+    # ПРИНУДИТЕЛЬНО: видимое всплывающее окно Tkinter
+    if _try_tkinter_notification(title, message, main_app):
+        logger.info("Tkinter уведомление показано")
         return
 
     # Резерв: Попытка через plyer (может не работать)
-    if _try_plyer_notification(title, message, max_retries):
+    if _try_plyer_notification(title, message):
         return
 
     # Последний резерв: Консольное уведомление с звуком
@@ -54,70 +67,94 @@ def _show_console_notification(title: str, message: str):
     print(f"[TIME] {time.strftime('%H:%M:%S')}")
     print(f"{'='*60}\n")
     
-    # Звуковой сигнал
+    # Звуковой сигнал: асинхронно, без ожидания окончания звука
     try:
-        import winsound
-        for i in range(3):  # 3 звуковых сигнала
-            winsound.Beep(1000, 300)
-            time.sleep(0.1)
-    except:
-        try:
-            for i in range(3):
-                print("\a", end="", flush=True)
-                time.sleep(0.2)
-        except:
-            pass
-
-def _try_plyer_notification(title: str, message: str, max_retries: int) -> bool:
-    """Попытка отправить уведомление через plyer."""
-    last_error = None
-    
-    for attempt in range(max_retries):
-        try:
-            if platform.system() == "Windows":
-                # Получаем абсолютный путь к иконке
-                try:
-                    icon_path = os.path.abspath("assets/icon.ico")
-                    if not os.path.exists(icon_path):
-                        icon_path = None
-                except:
-                    icon_path = None
-
-                notification.notify(
-                    title=title,
-                    message=message,
-                    app_name="Напоминалка",
-                    app_icon=icon_path,
-                    timeout=15
-                )
-                print("[OK] Plyer уведомление отправлено успешно")
-                return True
-            else:
-                # Для других ОС
-                notification.notify(title=title, message=message, timeout=15)
-                print("[OK] Plyer уведомление отправлено успешно")
-                return True
-        except Exception as e:
-            last_error = e
-            print(f"[ERR] Plyer попытка {attempt + 1} неудачна: {e}")
-            time.sleep(1)
-    
-    print(f"[ERR] Все попытки plyer неудачны. Последняя ошибка: {last_error}")
-    return False
+        if platform.system() == "Windows":
+            import winsound
+            winsound.PlaySound("SystemAsterisk", winsound.SND_ASYNC | winsound.SND_ALIAS)
+        else:
+            print("\a", end="", flush=True)
+    except Exception:
+        pass
+
+@functools.cache
+def _get_icon_path() -> str | None:
+    """
+    Возвращает абсолютный путь к иконке для plyer (используется только в Windows).
+    Путь и наличие файла проверяются один раз: иконка создается при запуске
+    приложения (create_icon) до первого уведомления.
+    """
+    if platform.system() != "Windows":
+        return None
+    icon_path = os.path.abspath(ICON_PATH)
+    return icon_path if os.path.exists(icon_path) else None
 
-def _try_tkinter_notification(title: str, message: str) -> bool:
-    """Показать простое всплывающее окно через messagebox (thread-safe)."""
+def _try_plyer_notification(title: str, message: str) -> bool:
+    """
+    Попытка отправить уведомление через plyer - одна, без повторов: ошибки plyer
+    (нет бэкенда, нет пользовательской сессии) не проходят сами, и при неудаче
+    сразу используется следующий способ уведомления.
+    """
+    try:
+        if platform.system() == "Windows":
+            notification.notify(
+                title=title,
+                message=message,
+                app_name="Напоминалка",
+                app_icon=_get_icon_path(),
+                timeout=15
+            )
+        else:
+            # Для других ОС
+            notification.notify(title=title, message=message, timeout=15)
+    except Exception as e:
+        logger.error("Plyer уведомление неудачно: %s", e)
+        return False
+    logger.info("Plyer уведомление отправлено успешно")
+    return True
+
+def _show_popup(master, title: str, message: str):
+    """Показывает немодальное окно уведомления, которое закрывается само через POPUP_TIMEOUT_MS."""
+    popup = ctk.CTkToplevel(master)
+    popup.title(title)
+    popup.attributes("-topmost", True)
+    popup.resizable(False, False)
+
+    # Таймер автозакрытия отменяется при закрытии кнопкой: иначе он сработает
+    # на уже удаленной команде Tcl и Tk сообщит "invalid command name"
+    timeout_id = popup.after(POPUP_TIMEOUT_MS, popup.destroy)
+
+    def close():
+        popup.after_cancel(timeout_id)
+        popup.destroy()
+
+    ctk.CTkLabel(popup, text=message, wraplength=360, justify="left").pack(padx=20, pady=(20, 10))
+    ctk.CTkButton(popup, text="OK", width=100, command=close).pack(pady=(0, 20))
+    popup.protocol("WM_DELETE_WINDOW", close)
+
+def _try_tkinter_notification(title: str, message: str, main_app=None) -> bool:
+    """
+    Показать всплывающее окно уведомления.
+
+    Если передано главное приложение, окно создается в главном потоке Tk через after()
+    и вызывающий поток (планировщик) не ждет, пока пользователь его закроет.
+    Без приложения используется модальный messagebox.
+    """
     try:
-        # Используем простой messagebox - он thread-safe и не требует отдельного потока
+        if main_app is not None:
+            main_app.after(0, _show_popup, main_app, title, message)
+            logger.info("Tkinter уведомление поставлено в очередь главного окна")
+            return True
         messagebox.showinfo(title, message)
-        print("[OK] Tkinter messagebox уведомление показано")
+        logger.info("Tkinter messagebox уведомление показано")
         return True
     except Exception as e:
-        print(f"[ERR] Tkinter уведомление неудачно: {e}")
+        logger.warning("Tkinter уведомление неудачно: %s", e)
         return False
 
 if __name__ == '__main__':
     # Пример для тестирования модуля
+    logging.basicConfig(level=logging.INFO)
     print("Отправка тестового уведомления...")
     send_notification(
         "Проверка связи!",
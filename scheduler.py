@@ -1,84 +1,192 @@
 import datetime
+import logging
+import threading
 import time
 from apscheduler.schedulers.background import BackgroundScheduler
 from database import Database
 from notifications import send_notification
 
-def check_reminders(db: Database, main_app=None):
+logger = logging.getLogger(__name__)
+
+# Идентификатор единственной задачи проверки напоминаний в планировщике
+CHECK_JOB_ID = "check_reminders"
+
+# Через сколько секунд выполнить контрольную проверку, если ожидающих напоминаний нет
+IDLE_CHECK_SECONDS = 3600
+
+# Задержка повторной проверки после ошибки; удваивается при каждой следующей
+# ошибке подряд, но не превышает IDLE_CHECK_SECONDS
+RETRY_DELAY_SECONDS = 60
+
+# Не дает двум проверкам (планировщик, запуск приложения) выполняться одновременно
+_tick_lock = threading.Lock()
+
+# Чтение ближайшего времени и add_job выполняются атомарно: иначе поток задачи
+# и поток UI (через callback изменений БД) могут перезаписать более раннее
+# время проверки более поздним, прочитанным до изменения
+_schedule_lock = threading.Lock()
+
+# Количество неудачных проверок подряд (для задержки повтора); меняется под _schedule_lock
+_failed_checks = 0
+
+def check_reminders(db: Database, main_app=None) -> bool:
     """
     Проверяет базу данных на наличие напоминаний, время которых наступило,
     отправляет уведомления и обновляет статусы. Также обновляет просроченные.
+    Если другая проверка еще выполняется, вызов сразу завершается.
+
+    :return: True, если проверка выполнена полностью; False при ошибке БД или
+        если проверка пропущена (наступившие напоминания могли остаться ожидающими).
+    """
+    if not _tick_lock.acquire(blocking=False):
+        logger.info("Предыдущая проверка напоминаний еще выполняется, пропуск")
+        return False
+    try:
+        return _check_reminders(db, main_app)
+    finally:
+        _tick_lock.release()
+
+
+def _check_reminders(db: Database, main_app=None) -> bool:
+    """
+    Тело check_reminders; вызывается под _tick_lock.
     """
     now = datetime.datetime.now()
-    print(f"[{now}] Запущена фоновая проверка напоминаний...")
+    logger.info("Запущена фоновая проверка напоминаний")
     
-    # 1. Обновить все старые "Ожидающие" напоминания на "Просрочено"
+    # 1-2. Одной транзакцией обновить просроченные и получить наступившие напоминания
     try:
-        db.update_overdue_reminders()
+        pending_reminders = db.fetch_and_mark_due(int(now.timestamp()))
     except Exception as e:
-        print(f"Ошибка при обновлении просроченных напоминаний: {e}")
-        return
+        logger.error("Ошибка при получении наступивших напоминаний: %s", e)
+        return False
+
+    # 3. Все выбранные напоминания уже наступили: выборка отфильтрована в SQL
+    # (due_datetime <= now), разбирать дату не нужно
+    fired = pending_reminders
+    for reminder in fired:
+        logger.info("Сработало напоминание ID %s: '%s'", reminder.id, reminder.title)
 
-    # 2. Получить все активные напоминания
+    if not fired:
+        return True
+    fired_ids = [reminder.id for reminder in fired]
+
+    # 4. Одно общее уведомление на все напоминания, сработавшие за эту проверку
+    if len(fired) == 1:
+        reminder = fired[0]
+        notification_title = f"Напоминание: {reminder.title}"
+        notification_message = reminder.description or "Время пришло!"
+    else:
+        notification_title = f"Сработало напоминаний: {len(fired)}"
+        notification_message = "\n".join(f"• {reminder.title}" for reminder in fired)
     try:
-        pending_reminders = db.get_reminders(status_filter="Ожидает")
-    except Exception as e:
-        print(f"Ошибка при получении ожидающих напоминаний: {e}")
-        return
-
-    # 3. Проверить каждое и отправить уведомление, если время пришло
-    for reminder in pending_reminders:
-        reminder_id, title, description, due_datetime_str, status = reminder
-        
-        try:
-            # Преобразуем строку ISO 8601 в объект datetime
+        send_notification(
+            title=notification_title,
+            message=notification_message,
+            reminder_ids=fired_ids,
+            main_app=main_app
+        )
+    except Exception as notification_error:
+        logger.error("Ошибка при отправке уведомления для напоминаний %s: %s", fired_ids, notification_error)
+        # Продолжаем выполнение даже если уведомление не отправилось
+
+    # 5. Обновить статусы всех сработавших напоминаний разом
+    try:
+        db.mark_completed_bulk(fired_ids)
+    except Exception as status_error:
+        logger.error("Ошибка при обновлении статусов сработавших напоминаний %s: %s", fired_ids, status_error)
+        return False
+    return True
+
+
+def _check_and_reschedule(scheduler: BackgroundScheduler, db: Database, main_app=None):
+    """
+    Задача планировщика: проверяет напоминания и планирует следующую проверку.
+    Следующая проверка планируется всегда, даже если текущая завершилась ошибкой:
+    однократная задача 'date' после запуска удаляется планировщиком.
+    """
+    check_ok = False
+    try:
+        check_ok = check_reminders(db, main_app)
+    finally:
+        schedule_next_check(scheduler, db, main_app, failed=not check_ok)
+
+
+def schedule_next_check(scheduler: BackgroundScheduler, db: Database, main_app=None,
+                        failed: bool = False):
+    """
+    Планирует однократную проверку напоминаний на время ближайшего ожидающего
+    напоминания. Если ожидающих напоминаний нет, контрольная проверка ставится
+    через IDLE_CHECK_SECONDS (1 час).
+
+    После неудачной проверки (или если ближайшее время не удалось прочитать)
+    повтор ставится через RETRY_DELAY_SECONDS с удвоением при ошибках подряд:
+    наступившее, но не обработанное напоминание иначе запускало бы проверку
+    немедленно и бесконечно.
+
+    Вызывается после каждой проверки и после изменения напоминаний
+    (см. Database.set_change_callback).
+
+    :param scheduler: Запущенный планировщик.
+    :param db: Экземпляр класса Database.
+    :param main_app: Ссылка на главное приложение для активации кнопок отсрочки.
+    :param failed: Предыдущая проверка завершилась ошибкой или была пропущена.
+    """
+    global _failed_checks
+    with _schedule_lock:
+        now_ts = time.time()
+        next_due_ts = None
+        if not failed:
             try:
-                due_datetime = datetime.datetime.fromisoformat(due_datetime_str)
-            except ValueError:
-                raise ValueError(f"Некорректный формат даты для напоминания ID {reminder_id}: '{due_datetime_str}'")
-
-            # Если время напоминания уже наступило
-            if due_datetime <= now:
-                print(f"Сработало напоминание ID {reminder_id}: '{title}'")
-
-                # Отправляем уведомление
-                try:
-                    send_notification(
-                        title=f"Напоминание: {title}",
-                        message=description or "Время пришло!",
-                        reminder_id=reminder_id,
-                        main_app=main_app
-                    )
-                except Exception as notification_error:
-                    print(f"Ошибка при отправке уведомления для напоминания ID {reminder_id}: {notification_error}")
-                    # Продолжаем выполнение даже если уведомление не отправилось
-
-                # Обновляем статус на "Выполнено"
-                try:
-                    db.update_reminder_status(reminder_id, "Выполнено")
-                except Exception as status_error:
-                    print(f"Ошибка при обновлении статуса напоминания ID {reminder_id}: {status_error}")
-        except Exception as e:
-            print(f"Критическая ошибка при обработке напоминания ID {reminder_id}: {e}")
+                next_due_ts = db.get_next_due_timestamp()
+            except Exception as e:
+                logger.error("Ошибка при получении ближайшего напоминания: %s", e)
+                failed = True
+
+        if failed:
+            _failed_checks += 1
+            retry_delay = min(RETRY_DELAY_SECONDS * 2 ** (_failed_checks - 1), IDLE_CHECK_SECONDS)
+            logger.warning("Повторная проверка напоминаний через %d с", retry_delay)
+            next_due_ts = now_ts + retry_delay
+        else:
+            _failed_checks = 0
+            if next_due_ts is None:
+                next_due_ts = now_ts + IDLE_CHECK_SECONDS
+        # Время с часовым поясом (UTC): наивное локальное время APScheduler локализует
+        # заново, и в повторяющийся час при переходе на зимнее время запуск мог
+        # опоздать на час
+        run_date = datetime.datetime.fromtimestamp(max(next_due_ts, now_ts), tz=datetime.timezone.utc)
+        # replace_existing: задача с тем же ID перепланируется, а не дублируется;
+        # misfire_grace_time=None: запоздавший запуск все равно выполняется;
+        # coalesce=True: пропущенные запуски не копятся.
+        # max_instances=2: задача перепланирует себя изнутри своего запуска, и новый
+        # запуск (run_date <= now) может быть отправлен до освобождения текущего;
+        # при max_instances=1 APScheduler отбросил бы его (MaxInstancesReachedError)
+        # и удалил однократную задачу. Параллельные проверки исключает _tick_lock
+        scheduler.add_job(_check_and_reschedule, 'date', run_date=run_date,
+                          args=[scheduler, db, main_app], id=CHECK_JOB_ID,
+                          replace_existing=True, misfire_grace_time=None,
+                          max_instances=2, coalesce=True)
 
 
 def start_scheduler(db: Database, main_app=None) -> BackgroundScheduler:
     """
     Инициализирует и запускает фоновый планировщик задач.
+    Проверка запускается не по интервалу, а ко времени ближайшего напоминания.
 
     :param db: Экземпляр класса Database для передачи в задачу.
     :param main_app: Ссылка на главное приложение для активации кнопок отсрочки.
     :return: Экземпляр запущенного планировщика.
     """
     scheduler = BackgroundScheduler(daemon=True)
-    # Запускать задачу `check_reminders` каждые 30 секунд
-    scheduler.add_job(check_reminders, 'interval', seconds=300, args=[db, main_app])
     scheduler.start()
-    print("Фоновый планировщик запущен.")
+    schedule_next_check(scheduler, db, main_app)
+    logger.info("Фоновый планировщик запущен")
     return scheduler
 
 if __name__ == '__main__':
     # Пример для тестирования модуля
+    logging.basicConfig(level=logging.INFO)
     print("Тестирование модуля планировщика...")
     
     # Создаем временную БД для теста
@@ -93,10 +201,8 @@ if __name__ == '__main__':
     )
     print(f"Тестовое напоминание добавлено на {due_time.isoformat()}")
 
-    # Запускаем планировщик с интервалом в 1 секунду для быстрого теста
-    test_scheduler = BackgroundScheduler(daemon=True)
-    test_scheduler.add_job(check_reminders, 'interval', seconds=1, args=[test_db])
-    test_scheduler.start()
+    # Планировщик сам запланирует проверку на время срабатывания напоминания
+    test_scheduler = start_scheduler(test_db)
 
     try:
         # Даем планировщику поработать 10 секунд
@@ -1,25 +1,78 @@
 import customtkinter as ctk
+import tkinter
 from tkinter import messagebox
 from datetime import datetime, timedelta
 from PIL import Image
 from pystray import Icon as pystray_Icon, MenuItem as pystray_MenuItem
 import threading
 import calendar
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 
-from database import Database
+from create_icon import ICON_PATH
+from database import Database, Reminder
 from notifications import send_notification
 
 # Глобальная переменная для иконки в трее, чтобы избежать сборки мусора
 tray_icon = None
 
+# Задержка перед обновлением списка после смены фильтра/сортировки (мс):
+# быстрые последовательные переключения сливаются в одно обновление
+REFRESH_DEBOUNCE_MS = 80
+
+# Период опроса фонового чтения списка из главного потока Tk (мс)
+LIST_POLL_MS = 15
+
+# Цвета статусов
+STATUS_COLORS = {
+    "Ожидает": "#FFFFFF",
+    "Выполнено": "#32a852",
+    "Просрочено": "#c94444",
+    "Отменено": "#808080"
+}
+
+# Изображение иконки трея: загружается и декодируется один раз за процесс
+_TRAY_ICON_IMAGE = None
+_TRAY_ICON_LOADED = False
+
+def _load_tray_icon():
+    """
+    Возвращает изображение иконки трея (PIL.Image) или None, если файла нет.
+    Файл читается только при первом вызове.
+    """
+    global _TRAY_ICON_IMAGE, _TRAY_ICON_LOADED
+    if not _TRAY_ICON_LOADED:
+        try:
+            image = Image.open(ICON_PATH)
+            image.load()
+            _TRAY_ICON_IMAGE = image
+        except FileNotFoundError:
+            print(f"ВНИМАНИЕ: Файл иконки '{ICON_PATH}' не найден. Функционал трея будет отключен.")
+        _TRAY_ICON_LOADED = True
+    return _TRAY_ICON_IMAGE
+
+# Виртуализация списка напоминаний: сколько строк сверх видимых держать
+# с каждой стороны и высота области списка до ее первой отрисовки (пиксели)
+LIST_BUFFER_ROWS = 5
+LIST_DEFAULT_VIEW_HEIGHT = 600
+
+# Названия месяцев (индекс - номер месяца), локализация вычисляется один раз
+MONTH_NAMES = tuple(calendar.month_name)
+
 class DateTimePickerWidget(ctk.CTkFrame):
     """Виджет для выбора даты и времени с календарем"""
     
+    # Календарь с неделями от понедельника, как в заголовке дней недели
+    _CAL = calendar.Calendar(firstweekday=0)
+    
     def __init__(self, master, initial_datetime=None):
         super().__init__(master)
         self.current_month = datetime.now().month
         self.current_year = datetime.now().year
         self.selected_date = None
+        self.selected_button = None  # Кнопка выбранного дня в текущем месяце (если видна)
+        self.day_button_by_day = {}  # День месяца -> кнопка, заполняется в refresh_calendar
         
         # Устанавливаем начальную дату
         if initial_datetime:
@@ -32,6 +85,10 @@ class DateTimePickerWidget(ctk.CTkFrame):
         
     def setup_calendar_ui(self):
         """Создает интерфейс календаря"""
+        # Общие шрифты заголовка месяца и дней недели
+        self._month_header_font = ctk.CTkFont(size=16, weight="bold")
+        self._weekday_font = ctk.CTkFont(weight="bold")
+        
         # Заголовок с навигацией по месяцам
         header_frame = ctk.CTkFrame(self)
         header_frame.pack(fill="x", padx=5, pady=5)
@@ -39,7 +96,7 @@ class DateTimePickerWidget(ctk.CTkFrame):
         self.prev_button = ctk.CTkButton(header_frame, text="<", width=30, command=self.prev_month)
         self.prev_button.pack(side="left", padx=5)
         
-        self.month_label = ctk.CTkLabel(header_frame, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.month_label = ctk.CTkLabel(header_frame, text="", font=self._month_header_font)
         self.month_label.pack(side="left", expand=True, fill="x")
         
         self.next_button = ctk.CTkButton(header_frame, text=">", width=30, command=self.next_month)
@@ -51,14 +108,29 @@ class DateTimePickerWidget(ctk.CTkFrame):
         
         weekdays = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
         for i, day in enumerate(weekdays):
-            label = ctk.CTkLabel(weekdays_frame, text=day, font=ctk.CTkFont(weight="bold"))
+            label = ctk.CTkLabel(weekdays_frame, text=day, font=self._weekday_font)
             label.grid(row=0, column=i, padx=2, pady=2, sticky="ew")
             weekdays_frame.grid_columnconfigure(i, weight=1)
         
-        # Календарная сетка
+        # Календарная сетка: 6 недель x 7 дней кнопок создаются один раз,
+        # при смене месяца у них меняются только текст, цвет и команда
         self.calendar_frame = ctk.CTkFrame(self)
         self.calendar_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
+        self.day_buttons = []
+        for week_num in range(6):
+            week_buttons = []
+            for day_num in range(7):
+                day_button = ctk.CTkButton(self.calendar_frame, text="", width=40, height=35)
+                day_button.grid(row=week_num, column=day_num, padx=1, pady=1, sticky="ew")
+                week_buttons.append(day_button)
+            self.day_buttons.append(week_buttons)
+        # Веса колонок задаются один раз; uniform - все колонки одной ширины
+        for day_num in range(7):
+            self.calendar_frame.grid_columnconfigure(day_num, weight=1, uniform="day")
+        # Цвет кнопки дня по умолчанию (из темы), чтобы снимать выделение
+        self.day_fg_color = self.day_buttons[0][0].cget("fg_color")
+        
         # Фрейм для выбора времени
         time_frame = ctk.CTkFrame(self)
         time_frame.pack(fill="x", padx=5, pady=5)
@@ -103,49 +175,53 @@ class DateTimePickerWidget(ctk.CTkFrame):
         
     def refresh_calendar(self):
         """Обновляет отображение календаря"""
-        # Очищаем старые кнопки
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
         # Обновляем заголовок
-        month_name = calendar.month_name[self.current_month]
+        month_name = MONTH_NAMES[self.current_month]
         self.month_label.configure(text=f"{month_name} {self.current_year}")
         
-        # Получаем данные календаря
-        cal = calendar.monthcalendar(self.current_year, self.current_month)
-        
-        # Создаем кнопки дней
-        for week_num, week in enumerate(cal):
-            for day_num, day in enumerate(week):
-                if day == 0:
-                    # Пустая ячейка
-                    label = ctk.CTkLabel(self.calendar_frame, text="")
-                    label.grid(row=week_num, column=day_num, padx=1, pady=1, sticky="ew")
-                else:
-                    # Кнопка дня
-                    is_selected = (self.selected_date and
-                                 self.selected_date.day == day and
-                                 self.selected_date.month == self.current_month and
-                                 self.selected_date.year == self.current_year)
-                    
-                    fg_color = ("gray75", "gray25") if is_selected else None
-                    
-                    day_button = ctk.CTkButton(
-                        self.calendar_frame,
-                        text=str(day),
-                        width=40,
-                        height=35,
-                        fg_color=fg_color,
-                        command=lambda d=day: self.select_date(d)
-                    )
-                    day_button.grid(row=week_num, column=day_num, padx=1, pady=1, sticky="ew")
+        # Перенастраиваем готовые кнопки дней: itermonthdays2 дает дни полными неделями
+        # (0 - день соседнего месяца), без промежуточного списка недель
+        self.selected_button = None
+        self.day_button_by_day = {}
+        # Ячейка выбранного дня вычисляется один раз: неделя начинается с понедельника,
+        # поэтому день d месяца стоит в ячейке (день недели 1-го числа) + d - 1
+        selected_cell = None
+        if (self.selected_date and
+                self.selected_date.month == self.current_month and
+                self.selected_date.year == self.current_year):
+            first_weekday = calendar.weekday(self.current_year, self.current_month, 1)
+            selected_cell = first_weekday + self.selected_date.day - 1
+        cell = 0
+        for cell, (day, _) in enumerate(self._CAL.itermonthdays2(self.current_year, self.current_month)):
+            week_num, day_num = divmod(cell, 7)
+            day_button = self.day_buttons[week_num][day_num]
+            if day == 0:
+                # Пустая ячейка
+                day_button.configure(text="", fg_color="transparent", state="disabled", command=None)
+            else:
+                # Кнопка дня
+                is_selected = cell == selected_cell
+                
+                fg_color = ("gray75", "gray25") if is_selected else self.day_fg_color
                 
-                self.calendar_frame.grid_columnconfigure(day_num, weight=1)
+                day_button.configure(text=str(day), fg_color=fg_color, state="normal",
+                                     command=partial(self.select_date, day))
+                self.day_button_by_day[day] = day_button
+                if is_selected:
+                    self.selected_button = day_button
+        
+        # Недостающие недели (до 6) - пустые
+        for cell in range(cell + 1, 42):
+            week_num, day_num = divmod(cell, 7)
+            self.day_buttons[week_num][day_num].configure(text="", fg_color="transparent", state="disabled", command=None)
     
     def select_date(self, day):
-        """Выбирает дату"""
+        """Выбирает дату: перекрашиваются только прежняя и новая кнопки дня"""
         self.selected_date = datetime(self.current_year, self.current_month, day).date()
-        self.refresh_calendar()
+        if self.selected_button is not None:
+            self.selected_button.configure(fg_color=self.day_fg_color)
+        self.selected_button = self.day_button_by_day[day]
+        self.selected_button.configure(fg_color=("gray75", "gray25"))
         
     def get_selected_datetime(self):
         """Возвращает выбранную дату и время как datetime объект"""
@@ -166,11 +242,15 @@ class DateTimePickerWidget(ctk.CTkFrame):
 class ReminderDialog(ctk.CTkToplevel):
     """
     Диалоговое окно для добавления или редактирования напоминания.
+    Окно не модально для цикла событий: вызывающий код не ждет его закрытия,
+    а получает on_save после успешного сохранения.
     """
-    def __init__(self, master, db: Database, reminder_data=None):
+    def __init__(self, master, db: Database, reminder_data: Reminder | None = None,
+                 on_save: Callable[[], None] | None = None):
         super().__init__(master)
         self.db = db
         self.reminder_data = reminder_data
+        self.on_save = on_save
         self.result = None
 
         is_edit = self.reminder_data is not None
@@ -197,7 +277,7 @@ class ReminderDialog(ctk.CTkToplevel):
         # Календарный виджет - создаем с учетом режима редактирования
         initial_dt = None
         if is_edit:
-            initial_dt = datetime.fromisoformat(self.reminder_data[3])
+            initial_dt = datetime.fromisoformat(self.reminder_data.due)
             
         self.datetime_picker = DateTimePickerWidget(self, initial_datetime=initial_dt)
         self.datetime_picker.pack(padx=20, pady=5, fill="both", expand=True)
@@ -207,8 +287,8 @@ class ReminderDialog(ctk.CTkToplevel):
 
         # --- Заполнение данных при редактировании ---
         if is_edit:
-            self.title_entry.insert(0, self.reminder_data[1])
-            self.desc_textbox.insert("1.0", self.reminder_data[2] or "")
+            self.title_entry.insert(0, self.reminder_data.title)
+            self.desc_textbox.insert("1.0", self.reminder_data.description or "")
 
     def save(self):
         """Сохраняет данные напоминания."""
@@ -224,24 +304,20 @@ class ReminderDialog(ctk.CTkToplevel):
             messagebox.showerror("Ошибка", "Выберите дату и введите корректное время (ЧЧ:ММ).", parent=self)
             return
 
-        due_datetime = selected_datetime.isoformat()
-
-        # Проверяем, что дата не в прошлом
-        try:
-            due_dt = datetime.fromisoformat(due_datetime)
-            if due_dt < datetime.now():
-                if not messagebox.askyesno("Предупреждение", "Указанная дата находится в прошлом. Продолжить?", parent=self):
-                    return
-        except ValueError:
-            messagebox.showerror("Ошибка", "Некорректная дата после преобразования.", parent=self)
-            return
+        # Проверяем, что дата не в прошлом (selected_datetime уже datetime, разбор строки не нужен)
+        if selected_datetime < datetime.now():
+            if not messagebox.askyesno("Предупреждение", "Указанная дата находится в прошлом. Продолжить?", parent=self):
+                return
 
+        # База принимает datetime напрямую, без промежуточной строки ISO 8601
         if self.reminder_data: # Редактирование
-            self.db.update_reminder(self.reminder_data[0], title, description, due_datetime)
+            self.db.update_reminder(self.reminder_data.id, title, description, selected_datetime)
         else: # Добавление
-            self.db.add_reminder(title, description, due_datetime)
+            self.db.add_reminder(title, description, selected_datetime)
         
         self.result = True
+        if self.on_save:
+            self.on_save()
         self.destroy()
 
 
@@ -262,15 +338,16 @@ class App(ctk.CTk):
         self.sort_order = ctk.StringVar(value="Сначала новые")
         self.selected_reminder_id = None
         self.selected_frame = None
-        self.active_notification_id = None  # ID активного уведомления для отсрочки
-
-        # --- Цвета статусов ---
-        self.STATUS_COLORS = {
-            "Ожидает": "#FFFFFF",
-            "Выполнено": "#32a852",
-            "Просрочено": "#c94444",
-            "Отменено": "#808080"
-        }
+        self._pending_refresh = None  # ID отложенного обновления списка (after)
+        # Чтение списка из БД идет в отдельном потоке, чтобы не подвешивать GUI;
+        # у каждого потока свое read-only соединение (см. Database._read_conn)
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
+        self._refresh_generation = 0  # Номер последнего запроса списка; старые ответы отбрасываются
+        self._row_pool = []  # Переиспользуемые строки списка напоминаний (см. _create_row)
+        self._due_fmt_cache = {}  # (ID, дата ISO 8601) -> дата для отображения
+        # Один шрифт на все метки статусов вместо нового CTkFont в каждой строке
+        self._status_font = ctk.CTkFont(weight="bold")
+        self.active_notification_ids = []  # ID напоминаний активного уведомления для отсрочки
 
         # --- Настройка сетки ---
         self.grid_columnconfigure(1, weight=1)
@@ -288,7 +365,7 @@ class App(ctk.CTk):
         self.filter_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.filter_menu = ctk.CTkSegmentedButton(self.control_frame, 
                                                   values=["Все", "Ожидает", "Выполнено", "Просрочено"],
-                                                  command=lambda v: self.refresh_reminders_list(),
+                                                  command=self._schedule_refresh,
                                                   variable=self.current_filter)
         self.filter_menu.grid(row=2, column=0, padx=20, pady=5, sticky="w")
 
@@ -296,7 +373,7 @@ class App(ctk.CTk):
         self.sort_label.grid(row=3, column=0, padx=20, pady=(10, 0), sticky="w")
         self.sort_menu = ctk.CTkOptionMenu(self.control_frame, 
                                            values=["Сначала новые", "Сначала старые"],
-                                           command=lambda v: self.refresh_reminders_list(),
+                                           command=self._schedule_refresh,
                                            variable=self.sort_order)
         self.sort_menu.grid(row=4, column=0, padx=20, pady=5, sticky="nw")
 
@@ -319,16 +396,16 @@ class App(ctk.CTk):
         )
         self.test_notification_button.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-        self.snooze_45_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 45 мин.", command=lambda: self._snooze_reminder(45))
+        self.snooze_45_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 45 мин.", command=partial(self._snooze_reminder, 45))
         self.snooze_45_btn.grid(row=2, column=0, padx=(10, 5), pady=5, sticky="ew")
         
-        self.snooze_15_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 15 мин.", command=lambda: self._snooze_reminder(15))
+        self.snooze_15_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 15 мин.", command=partial(self._snooze_reminder, 15))
         self.snooze_15_btn.grid(row=2, column=1, padx=(5, 10), pady=5, sticky="ew")
         
-        self.snooze_30_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 30 мин.", command=lambda: self._snooze_reminder(30))
+        self.snooze_30_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 30 мин.", command=partial(self._snooze_reminder, 30))
         self.snooze_30_btn.grid(row=3, column=0, padx=(10, 5), pady=5, sticky="ew")
         
-        self.snooze_60_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 1 час", command=lambda: self._snooze_reminder(60))
+        self.snooze_60_btn = ctk.CTkButton(self.quick_actions_frame, text="Отложить на 1 час", command=partial(self._snooze_reminder, 60))
         self.snooze_60_btn.grid(row=3, column=1, padx=(5, 10), pady=5, sticky="ew")
         
         # Изначально кнопки отсрочки отключены
@@ -338,6 +415,33 @@ class App(ctk.CTk):
         self.list_frame = ctk.CTkScrollableFrame(self, label_text="Список напоминаний")
         self.list_frame.grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
 
+        # Виртуализация: виджеты строк существуют только для видимой части списка
+        # (плюс запас), место остальных строк занимают две пустые распорки
+        # Цвет строки по умолчанию (для снятия выделения) читается один раз с пробного
+        # фрейма внутри списка: у вложенных фреймов CTk цвет отличается от фреймов окна
+        probe_frame = ctk.CTkFrame(self.list_frame)
+        self._default_row_fg = probe_frame.cget("fg_color")
+        probe_frame.destroy()
+        self._top_spacer = tkinter.Frame(self.list_frame, height=0, highlightthickness=0)
+        self._top_spacer.pack(fill="x")
+        self._bottom_spacer = tkinter.Frame(self.list_frame, height=0, highlightthickness=0)
+        self._bottom_spacer.pack(fill="x")
+        # Распорки - обычные фреймы Tk: их фон берется из цвета списка и
+        # переустанавливается при смене светлой/темной темы
+        self._list_fg_color = self.list_frame.cget("fg_color")
+        self._apply_spacer_color(ctk.get_appearance_mode())
+        ctk.AppearanceModeTracker.add(self._apply_spacer_color, self)
+        self._reminders = []  # Все напоминания текущего фильтра
+        self._row_stride = None  # Высота строки с отступами; измеряется по первой строке
+        self._visible_range = (0, 0)  # Индексы [first, last) отрисованных напоминаний
+        self._visible_update_pending = False
+        # Любая прокрутка (колесо, полоса, клавиши) проходит через yscrollcommand холста.
+        # Холст - Tk-родитель содержимого списка (master); прежняя команда (обновление
+        # полосы прокрутки) сохраняется и вызывается из _on_list_scroll
+        self._list_canvas = self.list_frame.master
+        self._list_scroll_command = self._list_canvas.cget("yscrollcommand")
+        self._list_canvas.configure(yscrollcommand=self._on_list_scroll)
+
         # --- Системный трей ---
         self.protocol("WM_DELETE_WINDOW", self.hide_to_tray)
         self.setup_tray()
@@ -348,12 +452,8 @@ class App(ctk.CTk):
     def setup_tray(self):
         """Настраивает иконку в системном трее."""
         global tray_icon
-        try:
-            # Попытка загрузить иконку. Если не получится, трей не будет создан.
-            image = Image.open("assets/icon.ico")
-        except FileNotFoundError:
-            print("ВНИМАНИЕ: Файл иконки 'assets/icon.ico' не найден. Функционал трея будет отключен.")
-            image = None
+        # Попытка загрузить иконку. Если не получится, трей не будет создан.
+        image = _load_tray_icon()
 
         if image:
             menu = (
@@ -381,77 +481,248 @@ class App(ctk.CTk):
         global tray_icon
         if tray_icon:
             tray_icon.stop()
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
         self.db.close()
         self.destroy()
 
-    def refresh_reminders_list(self):
-        """Обновляет список напоминаний в GUI."""
-        # Сбрасываем выбор при обновлении
-        self.selected_reminder_id = None
-        self.selected_frame = None
-        self.test_notification_button.configure(state="disabled")
+    def _schedule_refresh(self, *_):
+        """Откладывает обновление списка на REFRESH_DEBOUNCE_MS, отменяя ранее запланированное."""
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self):
+        """Выполняет отложенное обновление списка."""
+        self._pending_refresh = None
+        self.refresh_reminders_list()
 
-        # Очищаем старый список
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+    def _create_row(self) -> dict:
+        """
+        Создает виджеты одной строки списка напоминаний. Строки хранятся в пуле
+        и при обновлении списка перенастраиваются, а не создаются заново.
+        """
+        reminder_frame = ctk.CTkFrame(self.list_frame)
+        reminder_frame.grid_columnconfigure(0, weight=1)
+
+        # Основная информация
+        info_label = ctk.CTkLabel(reminder_frame, text="", justify="left")
+        info_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+
+        # Статус
+        status_label = ctk.CTkLabel(reminder_frame, text="", font=self._status_font)
+        status_label.grid(row=0, column=1, padx=10, pady=5)
+
+        # Кнопки управления
+        btn_frame = ctk.CTkFrame(reminder_frame, fg_color="transparent")
+        btn_frame.grid(row=0, column=2, padx=10, pady=5)
+
+        row = {
+            "reminder": None,
+            "frame": reminder_frame,
+            "info_label": info_label,
+            "status_label": status_label,
+            "edit_button": ctk.CTkButton(btn_frame, text="✏️", width=30),
+            "delete_button": ctk.CTkButton(btn_frame, text="🗑️", width=30),
+            "complete_button": ctk.CTkButton(btn_frame, text="✔️", width=30),
+            "cancel_button": ctk.CTkButton(btn_frame, text="❌", width=30),
+            "packed": False,
+            "selected": False,
+        }
+        row["edit_button"].pack(side="left", padx=2)
+        row["delete_button"].pack(side="left", padx=2)
+
+        # Привязываем событие клика к фрейму для выбора
+        # Также привязываем к дочерним элементам, чтобы клик срабатывал по всей области.
+        # bindtags не подходит: клик приходит во внутренние canvas/label виджетов CTk,
+        # поэтому один общий обработчик строки привязывается через их bind()
+        on_click = partial(self._on_row_click, row)
+        for widget in (reminder_frame, info_label, status_label):
+            widget.bind("<Button-1>", on_click)
+        return row
+
+    def _on_row_click(self, row: dict, event=None):
+        """Выбирает напоминание, отображаемое в строке списка."""
+        if row["reminder"] is not None:
+            self._select_reminder(row["reminder"], row["frame"])
+
+    def _fill_row(self, row: dict, reminder: Reminder):
+        """Показывает напоминание в строке из пула."""
+        reminder_id, title, desc, due_str, status = reminder
+        row["reminder"] = reminder
+
+        # Форматирование даты для отображения
+        key = (reminder_id, due_str)
+        due_display = self._due_fmt_cache.get(key)
+        if due_display is None:
+            due_display = datetime.fromisoformat(due_str).strftime('%d.%m.%Y в %H:%M')
+            self._due_fmt_cache[key] = due_display
+        row["info_label"].configure(text=f"{title}\n{due_display}")
+
+        status_color = STATUS_COLORS.get(status, "#FFFFFF")
+        row["status_label"].configure(text=status, text_color=status_color)
+
+        row["edit_button"].configure(command=partial(self.open_edit_dialog, reminder))
+        row["delete_button"].configure(command=partial(self.delete_reminder, reminder_id))
+        row["complete_button"].configure(command=partial(self.update_status, reminder_id, "Выполнено"))
+        row["cancel_button"].configure(command=partial(self.update_status, reminder_id, "Отменено"))
+        # Кнопки смены статуса показываются только для подходящих статусов (в прежнем порядке)
+        row["complete_button"].pack_forget()
+        row["cancel_button"].pack_forget()
+        if status == "Ожидает" or status == "Просрочено":
+            row["complete_button"].pack(side="left", padx=2)
+        if status == "Ожидает":
+            row["cancel_button"].pack(side="left", padx=2)
+
+        # Строка переиспользуется: выделение следует за напоминанием, а не за фреймом
+        is_selected = self.selected_reminder_id is not None and self.selected_reminder_id.id == reminder_id
+        if is_selected:
+            self.selected_frame = row["frame"]
+        elif self.selected_frame is row["frame"]:
+            self.selected_frame = None
+        if is_selected != row["selected"]:
+            row["frame"].configure(fg_color="#36719F" if is_selected else self._default_row_fg)
+            row["selected"] = is_selected
+
+    def _apply_spacer_color(self, mode_string: str):
+        """Красит распорки списка в цвет фона списка для текущей темы ("Light"/"Dark")."""
+        color = self._list_fg_color
+        if isinstance(color, (tuple, list)):
+            color = color[1] if mode_string.lower() == "dark" else color[0]
+        self._top_spacer.configure(bg=color)
+        self._bottom_spacer.configure(bg=color)
+
+    def _on_list_scroll(self, first, last):
+        """Обработчик прокрутки списка: двигает полосу и планирует перерисовку видимых строк."""
+        if self._list_scroll_command:
+            self.tk.call(self._list_scroll_command, first, last)
+        if not self._visible_update_pending:
+            self._visible_update_pending = True
+            self.after_idle(self._update_visible_rows)
+
+    def _update_visible_rows(self):
+        """Отложенная перерисовка видимых строк после прокрутки."""
+        self._visible_update_pending = False
+        self._render_visible_rows()
+
+    def _render_visible_rows(self, force: bool = False):
+        """
+        Отрисовывает только напоминания, попадающие в видимую область списка (с запасом
+        LIST_BUFFER_ROWS строк), на строках из пула; высоту остальных строк занимают распорки.
+
+        :param force: Перерисовать, даже если диапазон видимых строк не изменился.
+        """
+        count = len(self._reminders)
+        stride = self._row_stride
+        if stride:
+            view_height = self._list_canvas.winfo_height()
+            if view_height <= 1:
+                view_height = LIST_DEFAULT_VIEW_HEIGHT
+            top = self._list_canvas.yview()[0] * count * stride
+            first = max(0, int(top // stride) - LIST_BUFFER_ROWS)
+            last = min(count, int((top + view_height) // stride) + 1 + LIST_BUFFER_ROWS)
+        else:
+            first, last = 0, 0
+        if not force and (first, last) == self._visible_range:
+            return
+        self._visible_range = (first, last)
+
+        # Заполняем строки из пула, недостающие создаем
+        for i, reminder in enumerate(self._reminders[first:last]):
+            if i == len(self._row_pool):
+                self._row_pool.append(self._create_row())
+            row = self._row_pool[i]
+            if row["reminder"] is not reminder:
+                self._fill_row(row, reminder)
+            if not row["packed"]:
+                row["frame"].pack(fill="x", padx=5, pady=5, before=self._bottom_spacer)
+                row["packed"] = True
+
+        # Лишние строки прячем, но оставляем в пуле для следующих обновлений
+        for row in self._row_pool[last - first:]:
+            if row["packed"]:
+                row["frame"].pack_forget()
+                row["packed"] = False
+            row["reminder"] = None
+
+        if stride:
+            self._top_spacer.configure(height=first * stride)
+            self._bottom_spacer.configure(height=(count - last) * stride)
 
+    def refresh_reminders_list(self):
+        """
+        Обновляет список напоминаний в GUI. Данные читаются из БД в фоновом потоке,
+        список перестраивается в главном потоке, когда они готовы.
+        """
         # Получаем данные из БД с учетом фильтров
         status = self.current_filter.get()
         sort = "ASC" if self.sort_order.get() == "Сначала новые" else "DESC"
-        reminders = self.db.get_reminders(status_filter=status, sort_order=sort)
+        self._refresh_generation += 1
+        future = self._db_executor.submit(self.db.get_reminders, status_filter=status, sort_order=sort)
+        # Готовность результата проверяется из главного потока: фоновый поток не вызывает Tk
+        # (after() из другого потока падает, пока mainloop еще не запущен)
+        self.after(LIST_POLL_MS, self._poll_reminders, self._refresh_generation, future)
+
+    def _poll_reminders(self, generation: int, future: Future):
+        """Ждет результата фонового чтения и отрисовывает его, если за это время не был запрошен более новый."""
+        if generation != self._refresh_generation or future.cancelled():
+            return
+        if not future.done():
+            self.after(LIST_POLL_MS, self._poll_reminders, generation, future)
+            return
+        try:
+            reminders = future.result()
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось загрузить напоминания: {e}", parent=self)
+            return
+        self._render_reminders(reminders)
 
-        # Создаем виджеты для каждого напоминания
-        for i, reminder in enumerate(reminders):
-            reminder_id, title, desc, due_str, status = reminder
-            
-            reminder_frame = ctk.CTkFrame(self.list_frame)
-            reminder_frame.pack(fill="x", padx=5, pady=5)
-            reminder_frame.grid_columnconfigure(0, weight=1)
-
-            # Привязываем событие клика к фрейму для выбора
-            # Также привязываем к дочерним элементам, чтобы клик срабатывал по всей области
-            reminder_frame.bind("<Button-1>", lambda event, r=reminder, frame=reminder_frame: self._select_reminder(r, frame))
-
-            # Форматирование даты для отображения
-            due_dt = datetime.fromisoformat(due_str)
-            due_display = due_dt.strftime('%d.%m.%Y в %H:%M')
-
-            # Основная информация
-            info_label = ctk.CTkLabel(reminder_frame, text=f"{title}\n{due_display}", justify="left")
-            info_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-            info_label.bind("<Button-1>", lambda event, r=reminder, frame=reminder_frame: self._select_reminder(r, frame))
-
-            # Статус
-            status_color = self.STATUS_COLORS.get(status, "#FFFFFF")
-            status_label = ctk.CTkLabel(reminder_frame, text=status, text_color=status_color, font=ctk.CTkFont(weight="bold"))
-            status_label.grid(row=0, column=1, padx=10, pady=5)
-            status_label.bind("<Button-1>", lambda event, r=reminder, frame=reminder_frame: self._select_reminder(r, frame))
-
-            # Кнопки управления
-            btn_frame = ctk.CTkFrame(reminder_frame, fg_color="transparent")
-            btn_frame.grid(row=0, column=2, padx=10, pady=5)
-
-            ctk.CTkButton(btn_frame, text="✏️", width=30, command=lambda r=reminder: self.open_edit_dialog(r)).pack(side="left", padx=2)
-            ctk.CTkButton(btn_frame, text="🗑️", width=30, command=lambda r_id=reminder_id: self.delete_reminder(r_id)).pack(side="left", padx=2)
-            if status == "Ожидает" or status == "Просрочено":
-                ctk.CTkButton(btn_frame, text="✔️", width=30, command=lambda r_id=reminder_id: self.update_status(r_id, "Выполнено")).pack(side="left", padx=2)
-            if status == "Ожидает":
-                ctk.CTkButton(btn_frame, text="❌", width=30, command=lambda r_id=reminder_id: self.update_status(r_id, "Отменено")).pack(side="left", padx=2)
+    def _render_reminders(self, reminders: list):
+        """Перестраивает список напоминаний в GUI."""
+        # Сбрасываем выбор при обновлении
+        self.selected_reminder_id = None
+        self.selected_frame = None
+        self.test_notification_button.configure(state="disabled")
+
+        # Скрываем список на время перестройки: Tk не пересчитывает геометрию
+        # и не перерисовывает его после каждой добавленной строки
+        self.list_frame.grid_remove()
+
+        self._reminders = reminders
+
+        # В кэше отформатированных дат оставляем только текущие напоминания,
+        # так что даты измененных напоминаний не копятся
+        current_keys = {(reminder.id, reminder.due) for reminder in self._reminders}
+        self._due_fmt_cache = {key: value for key, value in self._due_fmt_cache.items() if key in current_keys}
+
+        # Высоту строки измеряем один раз, по первой отрисованной строке
+        if self._row_stride is None and self._reminders:
+            if not self._row_pool:
+                self._row_pool.append(self._create_row())
+            row = self._row_pool[0]
+            self._fill_row(row, self._reminders[0])
+            row["frame"].pack(fill="x", padx=5, pady=5, before=self._bottom_spacer)
+            row["packed"] = True
+            row["frame"].update_idletasks()
+            self._row_stride = row["frame"].winfo_reqheight() + 10  # pady=5 сверху и снизу
+
+        # Обновление после изменения данных: строки перезаполняются целиком
+        for row in self._row_pool:
+            row["reminder"] = None
+        self._render_visible_rows(force=True)
+
+        # Возвращаем список на место (с прежними параметрами grid) - одна перекомпоновка
+        self.list_frame.grid()
+        self.list_frame.update_idletasks()
 
     def open_add_dialog(self):
         """Открывает диалог добавления."""
         self.show_from_tray() # Показываем окно, если оно было в трее
-        dialog = ReminderDialog(self, self.db)
-        self.wait_window(dialog)
-        if dialog.result:
-            self.refresh_reminders_list()
+        # Без wait_window: вложенный цикл событий не нужен, список обновит on_save
+        ReminderDialog(self, self.db, on_save=self.refresh_reminders_list)
 
-    def open_edit_dialog(self, reminder_data):
+    def open_edit_dialog(self, reminder_data: Reminder):
         """Открывает диалог редактирования."""
-        dialog = ReminderDialog(self, self.db, reminder_data=reminder_data)
-        self.wait_window(dialog)
-        if dialog.result:
-            self.refresh_reminders_list()
+        ReminderDialog(self, self.db, reminder_data=reminder_data, on_save=self.refresh_reminders_list)
 
     def delete_reminder(self, reminder_id: int):
         """Удаляет напоминание после подтверждения."""
@@ -465,43 +736,33 @@ class App(ctk.CTk):
         self.refresh_reminders_list()
 
     def _snooze_reminder(self, minutes: int):
-        """Откладывает активное напоминание на указанное количество минут."""
-        if self.active_notification_id is None:
+        """Откладывает напоминания активного уведомления на указанное количество минут."""
+        if not self.active_notification_ids:
             messagebox.showwarning("Нет активного уведомления",
                                  "Нет активного уведомления для отсрочки.")
             return
 
         try:
-            # Получаем данные активного напоминания
-            reminders = self.db.get_reminders()
-            active_reminder = None
-            for reminder in reminders:
-                if reminder[0] == self.active_notification_id:
-                    active_reminder = reminder
-                    break
-
-            if not active_reminder:
-                messagebox.showerror("Ошибка", "Активное напоминание не найдено.")
-                self.active_notification_id = None
-                self._set_snooze_buttons_state(False)
-                return
-
             # Рассчитываем новое время
             now = datetime.now()
             new_due_time = now + timedelta(minutes=minutes)
-            new_due_time_str = new_due_time.isoformat()
-
-            # Обновляем напоминание
-            self.db.update_reminder(
-                self.active_notification_id,
-                active_reminder[1],  # title
-                active_reminder[2] + f"\n\nОтложено на {minutes} мин. в {now.strftime('%H:%M:%S')}",  # description
-                new_due_time_str
+
+            # Обновляем напоминания одним UPDATE по ID: время и заметка к описанию меняются в SQL,
+            # предварительно читать напоминания не нужно
+            snoozed_count = self.db.snooze_reminders(
+                self.active_notification_ids,
+                new_due_time,
+                f"\n\nОтложено на {minutes} мин. в {now.strftime('%H:%M:%S')}"
             )
 
             # Сбрасываем активное уведомление
-            self.active_notification_id = None
+            self.active_notification_ids = []
             self._set_snooze_buttons_state(False)
+
+            # Ни одна строка не изменилась - напоминания уже удалены
+            if snoozed_count == 0:
+                messagebox.showerror("Ошибка", "Активное напоминание не найдено.")
+                return
             
             # Обновляем список
             self.refresh_reminders_list()
@@ -521,16 +782,18 @@ class App(ctk.CTk):
 
     def set_active_notification(self, reminder_id: int):
         """Устанавливает активное уведомление и включает кнопки отсрочки."""
-        self.active_notification_id = reminder_id
+        self.set_active_notifications([reminder_id])
+
+    def set_active_notifications(self, reminder_ids: list[int]):
+        """Устанавливает активное уведомление сразу для нескольких напоминаний и включает кнопки отсрочки."""
+        self.active_notification_ids = list(reminder_ids)
         self._set_snooze_buttons_state(True)
 
-    def _select_reminder(self, reminder, frame):
+    def _select_reminder(self, reminder: Reminder, frame):
         """Обрабатывает выбор напоминания в списке."""
         # Сбрасываем цвет предыдущего выбранного элемента
         if self.selected_frame:
-            # Используем get для получения цвета по умолчанию, если он не был установлен
-            default_color = ctk.CTkFrame(self).cget("fg_color")
-            self.selected_frame.configure(fg_color=default_color)
+            self.selected_frame.configure(fg_color=self._default_row_fg)
 
         # Сохраняем новое выделение (весь объект reminder для простоты)
         self.selected_reminder_id = reminder
@@ -538,6 +801,8 @@ class App(ctk.CTk):
 
         # Выделяем новый элемент цветом
         self.selected_frame.configure(fg_color="#36719F") # Цвет выделения
+        for row in self._row_pool:
+            row["selected"] = row["frame"] is frame
 
         # Активируем кнопку "Тест уведомления"
         self.test_notification_button.configure(state="normal")
@@ -545,9 +810,9 @@ class App(ctk.CTk):
     def _send_test_notification(self):
         """Отправляет тестовое уведомление для выбранного элемента."""
         if self.selected_reminder_id is not None:
-            # Используем доступ по индексам, так как selected_reminder_id - это кортеж
-            title = self.selected_reminder_id[1]
-            message = self.selected_reminder_id[2]
+            # selected_reminder_id хранит выбранное напоминание целиком (Reminder)
+            title = self.selected_reminder_id.title
+            message = self.selected_reminder_id.description
             send_notification(title, message or "У этого напоминания нет описания.")
 
 